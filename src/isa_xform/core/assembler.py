@@ -80,6 +80,8 @@ class Assembler:
         self.symbol_table = symbol_table or SymbolTable()
         self.context = AssemblyContext()
         self.instruction_size_bytes = isa_definition.instruction_size // 8
+        # int.to_bytes byte order, resolved once from the ISA's endianness
+        self._byte_order = 'little' if isa_definition.endianness.lower().startswith('little') else 'big'
         
         # Build instruction lookup tables
         self._build_instruction_lookup()
@@ -602,7 +604,7 @@ class Assembler:
             instruction_length_bytes = instruction_length_bits // 8
             
             # Convert to bytes using bit utilities
-            endianness = 'little' if self.isa_definition.endianness.lower().startswith('little') else 'big'
+            endianness = self._byte_order
             instruction_bytes = int_to_bytes(encoded, instruction_length_bytes, endianness)
             
             # Update address using actual instruction length
@@ -1288,7 +1290,7 @@ class Assembler:
         
         for arg in node.arguments:
             value = self._parse_number(arg)
-            endianness = 'little' if self.isa_definition.endianness.lower().startswith('little') else 'big'
+            endianness = self._byte_order
             word_bytes = int_to_bytes(value, word_size, endianness)
             data.extend(word_bytes)
         
@@ -1303,7 +1305,7 @@ class Assembler:
         
         for arg in node.arguments:
             value = self._parse_number(arg)
-            endianness = 'little' if self.isa_definition.endianness.lower().startswith('little') else 'big'
+            endianness = self._byte_order
             half_bytes = int_to_bytes(value, half_size, endianness)
             data.extend(half_bytes)
         
@@ -1521,7 +1523,7 @@ class Assembler:
             value = self._parse_number(arg)
             # Add some "magic" to the value
             magic_value = value ^ 0xCAFEBABE
-            endianness = 'little' if self.isa_definition.endianness.lower().startswith('little') else 'big'
+            endianness = self._byte_order
             word_bytes = int_to_bytes(magic_value, word_size, endianness)
             data.extend(word_bytes)
         
@@ -1583,7 +1585,7 @@ class Assembler:
                 return None
             
             # Generate the fill data
-            endianness = 'little' if self.isa_definition.endianness.lower().startswith('little') else 'big'
+            endianness = self._byte_order
             data = bytearray()
             for _ in range(count):
                 data.extend(value.to_bytes(size, endianness))
@@ -39,6 +39,8 @@ class DirectiveHandler:
         self.isa_definition = isa_definition
         self.directives = isa_definition.directives
         self.syntax = isa_definition.assembly_syntax
+        # int.to_bytes byte order, resolved once from the ISA's endianness
+        self._byte_order = 'little' if isa_definition.endianness.lower().startswith('little') else 'big'
         
         # Build directive handlers
         self._build_handlers()
@@ -124,7 +126,7 @@ class DirectiveHandler:
         
         # Convert to bytes
         word_size = self.isa_definition.word_size // 8
-        endianness = 'little' if self.isa_definition.endianness.lower().startswith('little') else 'big'
+        endianness = self._byte_order
         
         bytes_data = bytearray()
         for value in values:
@@ -264,7 +266,7 @@ class DirectiveHandler:
                 raise ValueError(f"Value {value} does not fit in {size} bytes")
             
             # Generate the fill data
-            endianness = 'little' if self.isa_definition.endianness.lower().startswith('little') else 'big'
+            endianness = self._byte_order
             bytes_data = bytearray()
             for _ in range(count):
                 bytes_data.extend(value.to_bytes(size, endianness))
@@ -2,6 +2,7 @@
 Bit manipulation utilities for ISA transformation
 """
 
+from functools import lru_cache
 from typing import Tuple, List, Literal
 
 
@@ -85,7 +86,12 @@ def parse_bit_range(bit_range: str) -> Tuple[int, int]:
     """
     if not isinstance(bit_range, str):
         raise ValueError(f"Bit range must be a string, got {type(bit_range)}")
-    
+    return _parse_bit_range(bit_range)
+
+
+@lru_cache(maxsize=1024)
+def _parse_bit_range(bit_range: str) -> Tuple[int, int]:
+    """Parse a "high:low" string, cached since ISA field specs repeat the same few ranges"""
     try:
         parts = bit_range.split(":")
         if len(parts) != 2:
@@ -0,0 +1,760 @@
+; Disassembly of RV32I v2.1
+; Word size: 32 bits
+; Endianness: little
+
+    1000: [E3 E9 D1 13] BLTU gp, t4, 0x241012
+    1004: [C1 F1 2E ED] UNKNOWN ; 0xED2EF1C1
+    1008: [1E 97 AF 36] UNKNOWN ; 0x36AF971E
+    100C: [9B 75 07 25] UNKNOWN ; 0x2507759B
+    1010: [9C D1 99 4D] UNKNOWN ; 0x4D99D19C
+    1014: [57 53 C7 B2] UNKNOWN ; 0xB2C75357
+    1018: [72 67 74 E6] UNKNOWN ; 0xE6746772
+    101C: [6C 21 E0 3C] UNKNOWN ; 0x3CE0216C
+    1020: [4D 67 0A 7F] UNKNOWN ; 0x7F0A674D
+    1024: [8B F0 39 06] UNKNOWN ; 0x639F08B
+    1028: [B7 AF 61 B8] LUI t6, 0xB861A
+    102C: [53 6E DE 09] UNKNOWN ; 0x9DE6E53
+    1030: [75 06 A9 19] UNKNOWN ; 0x19A90675
+    1034: [F0 DF 20 53] UNKNOWN ; 0x5320DFF0
+    1038: [3B 0B 49 82] UNKNOWN ; 0x82490B3B
+    103C: [E5 3B 91 54] UNKNOWN ; 0x54913BE5
+    1040: [AE A0 D3 D7] UNKNOWN ; 0xD7D3A0AE
+    1044: [6D A5 9B 0E] UNKNOWN ; 0xE9BA56D
+    1048: [F3 2C D6 85] UNKNOWN ; 0x85D62CF3
+    104C: [9E 04 C9 B0] UNKNOWN ; 0xB0C9049E
+    1050: [93 E8 D7 F1] ORI a7, a5, 3869
+    1054: [4E 01 1F FE] UNKNOWN ; 0xFE1F014E
+    1058: [55 A7 BD E1] UNKNOWN ; 0xE1BDA755
+    105C: [97 5F 01 78] AUIPC t6, 0x78015
+    1060: [52 47 F7 5E] UNKNOWN ; 0x5EF74752
+    1064: [3B 0C E9 99] UNKNOWN ; 0x99E90C3B
+    1068: [65 E5 30 00] UNKNOWN ; 0x30E565
+    106C: [90 5A DB 8A] UNKNOWN ; 0x8ADB5A90
+    1070: [B6 30 59 C1] UNKNOWN ; 0xC15930B6
+    1074: [06 AB 12 C8] UNKNOWN ; 0xC812AB06
+    1078: [84 5A 5C 20] UNKNOWN ; 0x205C5A84
+    107C: [37 26 50 86] LUI a2, 0x86502
+    1080: [A9 BF 68 02] UNKNOWN ; 0x268BFA9
+    1084: [50 BA 47 7C] UNKNOWN ; 0x7C47BA50
+    1088: [C5 1D 0E BB] UNKNOWN ; 0xBB0E1DC5
+    108C: [79 EC E2 C5] UNKNOWN ; 0xC5E2EC79
+    1090: [97 7D C4 D7] AUIPC s11, 0xD7C47
+    1094: [38 84 F5 33] UNKNOWN ; 0x33F58438
+    1098: [F0 F1 29 D6] UNKNOWN ; 0xD629F1F0
+    109C: [A5 3A AF 49] UNKNOWN ; 0x49AF3AA5
+    10A0: [2B 60 14 F4] UNKNOWN ; 0xF414602B
+    10A4: [49 8F D2 EC] UNKNOWN ; 0xECD28F49
+    10A8: [5D A9 A0 33] UNKNOWN ; 0x33A0A95D
+    10AC: [A9 EA 3D 72] UNKNOWN ; 0x723DEAA9
+    10B0: [F2 3B DD 14] UNKNOWN ; 0x14DD3BF2
+    10B4: [82 85 8D 55] UNKNOWN ; 0x558D8582
+    10B8: [F5 79 E9 1E] UNKNOWN ; 0x1EE979F5
+    10BC: [29 25 00 09] UNKNOWN ; 0x9002529
+    10C0: [6F 8A 4D FA] JAL s4, 0x7B598
+    10C4: [EC D6 84 86] UNKNOWN ; 0x8684D6EC
+    10C8: [86 24 A7 1C] UNKNOWN ; 0x1CA72486
+    10CC: [AA FA 48 BA] UNKNOWN ; 0xBA48FAAA
+    10D0: [D4 C5 D7 28] UNKNOWN ; 0x28D7C5D4
+    10D4: [01 F1 58 70] UNKNOWN ; 0x7058F101
+    10D8: [30 3F 25 05] UNKNOWN ; 0x5253F30
+    10DC: [D6 79 6F 6E] UNKNOWN ; 0x6E6F79D6
+    10E0: [DE 09 A1 0C] UNKNOWN ; 0xCA109DE
+    10E4: [8F A1 FB EB] UNKNOWN ; 0xEBFBA18F
+    10E8: [C1 D6 CB 09] UNKNOWN ; 0x9CBD6C1
+    10EC: [26 B5 38 8E] UNKNOWN ; 0x8E38B526
+    10F0: [83 54 60 5A] LHU s1
+    10F4: [B3 B1 0E 3A] UNKNOWN ; 0x3A0EB1B3
+    10F8: [F6 F3 CB 29] UNKNOWN ; 0x29CBF3F6
+    10FC: [4C 2F CF 77] UNKNOWN ; 0x77CF2F4C
+    1100: [34 D7 46 4F] UNKNOWN ; 0x4F46D734
+    1104: [4A 64 7A BA] UNKNOWN ; 0xBA7A644A
+    1108: [76 81 C6 ED] UNKNOWN ; 0xEDC68176
+    110C: [A7 74 0D 7E] UNKNOWN ; 0x7E0D74A7
+    1110: [36 1D E0 2A] UNKNOWN ; 0x2AE01D36
+    1114: [E0 46 DE 88] UNKNOWN ; 0x88DE46E0
+    1118: [8D A7 79 D0] UNKNOWN ; 0xD079A78D
+    111C: [3D C0 02 D0] UNKNOWN ; 0xD002C03D
+    1120: [04 FE 04 BD] UNKNOWN ; 0xBD04FE04
+    1124: [9C 29 9E 4C] UNKNOWN ; 0x4C9E299C
+    1128: [31 A9 8A 91] UNKNOWN ; 0x918AA931
+    112C: [C2 B5 72 93] UNKNOWN ; 0x9372B5C2
+    1130: [92 BE 60 93] UNKNOWN ; 0x9360BE92
+    1134: [9C 46 17 15] UNKNOWN ; 0x1517469C
+    1138: [D5 2E 28 C5] UNKNOWN ; 0xC5282ED5
+    113C: [0B FF 7B 08] UNKNOWN ; 0x87BFF0B
+    1140: [F9 C8 4B 96] UNKNOWN ; 0x964BC8F9
+    1144: [B1 5D 4B 4A] UNKNOWN ; 0x4A4B5DB1
+    1148: [BC 1B B3 3A] UNKNOWN ; 0x3AB31BBC
+    114C: [44 37 D5 49] UNKNOWN ; 0x49D53744
+    1150: [07 AF 58 54] UNKNOWN ; 0x5458AF07
+    1154: [23 7D 24 14] UNKNOWN ; 0x14247D23
+    1158: [84 A6 77 3E] UNKNOWN ; 0x3E77A684
+    115C: [36 F1 B6 A9] UNKNOWN ; 0xA9B6F136
+    1160: [91 95 90 66] UNKNOWN ; 0x66909591
+    1164: [4D DA 62 D7] UNKNOWN ; 0xD762DA4D
+    1168: [6E 2F BD FC] UNKNOWN ; 0xFCBD2F6E
+    116C: [6F 09 11 4A] JAL s2, 0x4B17C
+    1170: [43 9D 3F 6D] UNKNOWN ; 0x6D3F9D43
+    1174: [BA DB 56 B2] UNKNOWN ; 0xB256DBBA
+    1178: [94 FD D3 11] UNKNOWN ; 0x11D3FD94
+    117C: [D7 34 16 CB] UNKNOWN ; 0xCB1634D7
+    1180: [87 03 0C 7A] UNKNOWN ; 0x7A0C0387
+    1184: [A7 7B 55 02] UNKNOWN ; 0x2557BA7
+    1188: [D8 4C 0C D0] UNKNOWN ; 0xD00C4CD8
+    118C: [38 A7 1D 2E] UNKNOWN ; 0x2E1DA738
+    1190: [45 9B 0F 72] UNKNOWN ; 0x720F9B45
+    1194: [C3 25 B4 29] UNKNOWN ; 0x29B425C3
+    1198: [84 07 CA B3] UNKNOWN ; 0xB3CA0784
+    119C: [6E FD CA FD] UNKNOWN ; 0xFDCAFD6E
+    11A0: [D4 8F 45 17] UNKNOWN ; 0x17458FD4
+    11A4: [F1 BA 04 DD] UNKNOWN ; 0xDD04BAF1
+    11A8: [28 B8 F9 0F] UNKNOWN ; 0xFF9B828
+    11AC: [62 FB DD 21] UNKNOWN ; 0x21DDFB62
+    11B0: [BE 25 68 A9] UNKNOWN ; 0xA96825BE
+    11B4: [DD 81 88 42] UNKNOWN ; 0x428881DD
+    11B8: [E8 23 5B 0C] UNKNOWN ; 0xC5B23E8
+    11BC: [E7 BE 4F 8D] UNKNOWN ; 0x8D4FBEE7
+    11C0: [C7 63 50 4D] UNKNOWN ; 0x4D5063C7
+    11C4: [A5 EF 42 25] UNKNOWN ; 0x2542EFA5
+    11C8: [CF A3 76 62] UNKNOWN ; 0x6276A3CF
+    11CC: [23 85 51 0E] SB t0, gp
+    11D0: [83 1C 8A 31] LH s9
+    11D4: [92 C0 E5 96] UNKNOWN ; 0x96E5C092
+    11D8: [E2 32 4F 09] UNKNOWN ; 0x94F32E2
+    11DC: [EF 7E 5D 7D] JAL t4, 0x7E6B3
+    11E0: [53 9C B9 01] UNKNOWN ; 0x1B99C53
+    11E4: [11 18 1E 81] UNKNOWN ; 0x811E1811
+    11E8: [D0 F7 9D F3] UNKNOWN ; 0xF39DF7D0
+    11EC: [A9 6E 46 86] UNKNOWN ; 0x86466EA9
+    11F0: [A9 B8 4E B0] UNKNOWN ; 0xB04EB8A9
+    11F4: [F9 E6 CA 53] UNKNOWN ; 0x53CAE6F9
+    11F8: [33 AA A8 F3] UNKNOWN ; 0xF3A8AA33
+    11FC: [D3 D5 4D 5C] UNKNOWN ; 0x5C4DD5D3
+    1200: [FB 77 E0 7D] UNKNOWN ; 0x7DE077FB
+    1204: [E3 47 89 7A] BLT s2, s0, 0xF41212
+    1208: [5F 81 54 F4] UNKNOWN ; 0xF454815F
+    120C: [B8 E8 9F EF] UNKNOWN ; 0xEF9FE8B8
+    1210: [FC E4 CF DC] UNKNOWN ; 0xDCCFE4FC
+    1214: [44 B3 EA 3F] UNKNOWN ; 0x3FEAB344
+    1218: [70 32 37 9E] UNKNOWN ; 0x9E373270
+    121C: [87 1E A7 52] UNKNOWN ; 0x52A71E87
+    1220: [D1 E9 70 86] UNKNOWN ; 0x8670E9D1
+    1224: [96 4A 32 92] UNKNOWN ; 0x92324A96
+    1228: [8A 24 38 82] UNKNOWN ; 0x8238248A
+    122C: [0D 82 B0 3B] UNKNOWN ; 0x3BB0820D
+    1230: [D9 F8 B7 39] UNKNOWN ; 0x39B7F8D9
+    1234: [B7 95 2D 62] LUI a1, 0x622D9
+    1238: [6E 73 4F 60] UNKNOWN ; 0x604F736E
+    123C: [0E 50 A1 94] UNKNOWN ; 0x94A1500E
+    1240: [0D 26 10 B9] UNKNOWN ; 0xB910260D
+    1244: [32 57 EA 5E] UNKNOWN ; 0x5EEA5732
+    1248: [1B 41 FB 31] UNKNOWN ; 0x31FB411B
+    124C: [28 F9 05 D4] UNKNOWN ; 0xD405F928
+    1250: [06 3E 94 D9] UNKNOWN ; 0xD9943E06
+    1254: [8F 13 42 F5] UNKNOWN ; 0xF542138F
+    1258: [4F 7A 84 82] UNKNOWN ; 0x82847A4F
+    125C: [B8 67 ED 20] UNKNOWN ; 0x20ED67B8
+    1260: [7A CB AA 9A] UNKNOWN ; 0x9AAACB7A
+    1264: [78 C6 30 AF] UNKNOWN ; 0xAF30C678
+    1268: [FE E3 63 D2] UNKNOWN ; 0xD263E3FE
+    126C: [C9 0B D4 59] UNKNOWN ; 0x59D40BC9
+    1270: [BE ED 6C A5] UNKNOWN ; 0xA56CEDBE
+    1274: [9C 94 D8 5E] UNKNOWN ; 0x5ED8949C
+    1278: [D4 C7 41 23] UNKNOWN ; 0x2341C7D4
+    127C: [FE 93 06 9F] UNKNOWN ; 0x9F0693FE
+    1280: [39 AA 6C 3F] UNKNOWN ; 0x3F6CAA39
+    1284: [0D 44 BF F7] UNKNOWN ; 0xF7BF440D
+    1288: [86 45 45 00] UNKNOWN ; 0x454586
+    128C: [D9 D0 CB 7F] UNKNOWN ; 0x7FCBD0D9
+    1290: [B9 CE 02 07] UNKNOWN ; 0x702CEB9
+    1294: [F8 43 92 1B] UNKNOWN ; 0x1B9243F8
+    1298: [FA 39 94 F3] UNKNOWN ; 0xF39439FA
+    129C: [51 58 4B 00] UNKNOWN ; 0x4B5851
+    12A0: [35 2A CE 97] UNKNOWN ; 0x97CE2A35
+    12A4: [26 FB CF DA] UNKNOWN ; 0xDACFFB26
+    12A8: [CD 32 02 F8] UNKNOWN ; 0xF80232CD
+    12AC: [ED 6F B8 2A] UNKNOWN ; 0x2AB86FED
+    12B0: [28 5A D3 C7] UNKNOWN ; 0xC7D35A28
+    12B4: [82 9D C2 DA] UNKNOWN ; 0xDAC29D82
+    12B8: [58 1C D9 50] UNKNOWN ; 0x50D91C58
+    12BC: [9D 46 16 C7] UNKNOWN ; 0xC716469D
+    12C0: [F9 50 98 F7] UNKNOWN ; 0xF79850F9
+    12C4: [BA 95 B4 6A] UNKNOWN ; 0x6AB495BA
+    12C8: [B8 F9 2C EC] UNKNOWN ; 0xEC2CF9B8
+    12CC: [65 AF F5 39] UNKNOWN ; 0x39F5AF65
+    12D0: [86 99 D1 74] UNKNOWN ; 0x74D19986
+    12D4: [9B 32 91 66] UNKNOWN ; 0x6691329B
+    12D8: [D6 A9 50 15] UNKNOWN ; 0x1550A9D6
+    12DC: [A2 77 67 FA] UNKNOWN ; 0xFA6777A2
+    12E0: [94 FC 84 51] UNKNOWN ; 0x5184FC94
+    12E4: [7D 86 1D 6F] UNKNOWN ; 0x6F1D867D
+    12E8: [FC 8D 92 2A] UNKNOWN ; 0x2A928DFC
+    12EC: [2C 6F B0 F0] UNKNOWN ; 0xF0B06F2C
+    12F0: [42 E4 96 5D] UNKNOWN ; 0x5D96E442
+    12F4: [83 30 8A 4D] UNKNOWN ; 0x4D8A3083
+    12F8: [F6 0C 20 15] UNKNOWN ; 0x15200CF6
+    12FC: [CE 5E BF EA] UNKNOWN ; 0xEABF5ECE
+    1300: [31 21 97 B6] UNKNOWN ; 0xB6972131
+    1304: [90 90 92 80] UNKNOWN ; 0x80929090
+    1308: [13 3F C4 FA] SLTIU t5, s0, 4012
+    130C: [6C DF F9 C7] UNKNOWN ; 0xC7F9DF6C
+    1310: [D7 70 F4 35] UNKNOWN ; 0x35F470D7
+    1314: [36 B5 39 21] UNKNOWN ; 0x2139B536
+    1318: [D4 5A B0 C7] UNKNOWN ; 0xC7B05AD4
+    131C: [FA 6A 18 B1] UNKNOWN ; 0xB1186AFA
+    1320: [2A 68 9C 95] UNKNOWN ; 0x959C682A
+    1324: [7A 72 16 43] UNKNOWN ; 0x4316727A
+    1328: [E2 AA 8E 7B] UNKNOWN ; 0x7B8EAAE2
+    132C: [9B D3 2E AE] UNKNOWN ; 0xAE2ED39B
+    1330: [B4 FF 44 E8] UNKNOWN ; 0xE844FFB4
+    1334: [69 15 D2 5D] UNKNOWN ; 0x5DD21569
+    1338: [2B B0 97 60] UNKNOWN ; 0x6097B02B
+    133C: [A1 14 D4 17] UNKNOWN ; 0x17D414A1
+    1340: [A5 35 32 D2] UNKNOWN ; 0xD23235A5
+    1344: [0C 47 51 C4] UNKNOWN ; 0xC451470C
+    1348: [DE F0 E5 08] UNKNOWN ; 0x8E5F0DE
+    134C: [8E 7A 8A 9B] UNKNOWN ; 0x9B8A7A8E
+    1350: [9D 6B 21 F7] UNKNOWN ; 0xF7216B9D
+    1354: [86 60 21 DF] UNKNOWN ; 0xDF216086
+    1358: [69 0D BF 2E] UNKNOWN ; 0x2EBF0D69
+    135C: [30 FF 3D E2] UNKNOWN ; 0xE23DFF30
+    1360: [E3 13 F5 00] BNE a0, a5, 0x1366
+    1364: [35 3C 5B 0C] UNKNOWN ; 0xC5B3C35
+    1368: [59 5A 9E E1] UNKNOWN ; 0xE19E5A59
+    136C: [89 A7 13 99] UNKNOWN ; 0x9913A789
+    1370: [6F 88 AF B8] JAL a6, 0x39E68
+    1374: [85 43 BC 32] UNKNOWN ; 0x32BC4385
+    1378: [7E 40 C0 AC] UNKNOWN ; 0xACC0407E
+    137C: [F8 3B A8 87] UNKNOWN ; 0x87A83BF8
+    1380: [A4 AA 15 C4] UNKNOWN ; 0xC415AAA4
+    1384: [94 E8 60 52] UNKNOWN ; 0x5260E894
+    1388: [5C CB 9A 60] UNKNOWN ; 0x609ACB5C
+    138C: [D0 59 7B 38] UNKNOWN ; 0x387B59D0
+    1390: [3F 52 4A 1D] UNKNOWN ; 0x1D4A523F
+    1394: [03 A2 77 66] LW tp, 1639(a5)
+    1398: [A6 29 75 51] UNKNOWN ; 0x517529A6
+    139C: [42 FF C5 30] UNKNOWN ; 0x30C5FF42
+    13A0: [B1 FD 22 F4] UNKNOWN ; 0xF422FDB1
+    13A4: [C6 66 B2 A7] UNKNOWN ; 0xA7B266C6
+    13A8: [88 D2 40 FB] UNKNOWN ; 0xFB40D288
+    13AC: [1A 78 F0 27] UNKNOWN ; 0x27F0781A
+    13B0: [EE AB E2 3A] UNKNOWN ; 0x3AE2ABEE
+    13B4: [67 20 A4 9E] UNKNOWN ; 0x9EA42067
+    13B8: [00 77 35 71] UNKNOWN ; 0x71357700
+    13BC: [C0 06 D7 0E] UNKNOWN ; 0xED706C0
+    13C0: [B2 39 5B 73] UNKNOWN ; 0x735B39B2
+    13C4: [56 9F 3E AE] UNKNOWN ; 0xAE3E9F56
+    13C8: [CA CD 7A E7] UNKNOWN ; 0xE77ACDCA
+    13CC: [70 E7 A8 06] UNKNOWN ; 0x6A8E770
+    13D0: [2B 36 6A 01] UNKNOWN ; 0x16A362B
+    13D4: [54 42 EE 76] UNKNOWN ; 0x76EE4254
+    13D8: [9E 6F 47 D4] UNKNOWN ; 0xD4476F9E
+    13DC: [2E 68 9C D8] UNKNOWN ; 0xD89C682E
+    13E0: [D3 C6 E1 40] UNKNOWN ; 0x40E1C6D3
+    13E4: [53 9C 1D 04] UNKNOWN ; 0x41D9C53
+    13E8: [F9 4F 94 8C] UNKNOWN ; 0x8C944FF9
+    13EC: [FA 8C 84 11] UNKNOWN ; 0x11848CFA
+    13F0: [5B A1 0C 21] UNKNOWN ; 0x210CA15B
+    13F4: [E4 A9 0B 59] UNKNOWN ; 0x590BA9E4
+    13F8: [88 11 86 15] UNKNOWN ; 0x15861188
+    13FC: [BC 3F 22 BA] UNKNOWN ; 0xBA223FBC
+    1400: [3A B7 11 E2] UNKNOWN ; 0xE211B73A
+    1404: [E5 9D DF 1E] UNKNOWN ; 0x1EDF9DE5
+    1408: [FC CE BF 80] UNKNOWN ; 0x80BFCEFC
+    140C: [AD 0B EB 38] UNKNOWN ; 0x38EB0BAD
+    1410: [8F 19 C9 F8] UNKNOWN ; 0xF8C9198F
+    1414: [8A CC 83 AD] UNKNOWN ; 0xAD83CC8A
+    1418: [CA D5 66 DD] UNKNOWN ; 0xDD66D5CA
+    141C: [BB A8 9F 56] UNKNOWN ; 0x569FA8BB
+    1420: [E5 A3 9F C0] UNKNOWN ; 0xC09FA3E5
+    1424: [EA CF 84 A3] UNKNOWN ; 0xA384CFEA
+    1428: [E6 E0 1B 13] UNKNOWN ; 0x131BE0E6
+    142C: [86 0D 16 4E] UNKNOWN ; 0x4E160D86
+    1430: [68 70 DC 96] UNKNOWN ; 0x96DC7068
+    1434: [BD 6F 79 2E] UNKNOWN ; 0x2E796FBD
+    1438: [B6 5E 03 FE] UNKNOWN ; 0xFE035EB6
+    143C: [2D D4 62 3B] UNKNOWN ; 0x3B62D42D
+    1440: [50 29 C5 80] UNKNOWN ; 0x80C52950
+    1444: [C7 7F 01 CC] UNKNOWN ; 0xCC017FC7
+    1448: [9F 96 DE 10] UNKNOWN ; 0x10DE969F
+    144C: [33 0F CA 19] UNKNOWN ; 0x19CA0F33
+    1450: [EC 4F 49 2F] UNKNOWN ; 0x2F494FEC
+    1454: [8A 3D 85 F4] UNKNOWN ; 0xF4853D8A
+    1458: [66 62 EA FC] UNKNOWN ; 0xFCEA6266
+    145C: [3F 77 F5 04] UNKNOWN ; 0x4F5773F
+    1460: [1C 46 12 FA] UNKNOWN ; 0xFA12461C
+    1464: [04 A5 4C 04] UNKNOWN ; 0x44CA504
+    1468: [20 0A 3E 3F] UNKNOWN ; 0x3F3E0A20
+    146C: [A1 8D D7 F9] UNKNOWN ; 0xF9D78DA1
+    1470: [B7 ED 85 51] LUI s11, 0x5185E
+    1474: [0E 5F 5E 5D] UNKNOWN ; 0x5D5E5F0E
+    1478: [D0 62 08 B7] UNKNOWN ; 0xB70862D0
+    147C: [EC D8 64 A5] UNKNOWN ; 0xA564D8EC
+    1480: [5E F4 F4 81] UNKNOWN ; 0x81F4F45E
+    1484: [42 81 46 59] UNKNOWN ; 0x59468142
+    1488: [D4 96 7D 2F] UNKNOWN ; 0x2F7D96D4
+    148C: [86 6D A5 9D] UNKNOWN ; 0x9DA56D86
+    1490: [D3 30 06 FC] UNKNOWN ; 0xFC0630D3
+    1494: [1D 16 57 02] UNKNOWN ; 0x257161D
+    1498: [9B D5 E6 9E] UNKNOWN ; 0x9EE6D59B
+    149C: [20 A8 D6 B0] UNKNOWN ; 0xB0D6A820
+    14A0: [57 E4 7A 5D] UNKNOWN ; 0x5D7AE457
+    14A4: [E6 CC EF 02] UNKNOWN ; 0x2EFCCE6
+    14A8: [7F CC A0 05] UNKNOWN ; 0x5A0CC7F
+    14AC: [65 01 B8 8F] UNKNOWN ; 0x8FB80165
+    14B0: [CE 03 A8 82] UNKNOWN ; 0x82A803CE
+    14B4: [0E 65 B9 06] UNKNOWN ; 0x6B9650E
+    14B8: [38 F5 81 C0] UNKNOWN ; 0xC081F538
+    14BC: [77 95 3E F1] UNKNOWN ; 0xF13E9577
+    14C0: [6C 39 88 2D] UNKNOWN ; 0x2D88396C
+    14C4: [E9 5F 90 1B] UNKNOWN ; 0x1B905FE9
+    14C8: [B5 B8 55 16] UNKNOWN ; 0x1655B8B5
+    14CC: [E6 7F 7C AE] UNKNOWN ; 0xAE7C7FE6
+    14D0: [D2 3F 5F B9] UNKNOWN ; 0xB95F3FD2
+    14D4: [0F 4D 8A A3] UNKNOWN ; 0xA38A4D0F
+    14D8: [8B A5 9E EB] UNKNOWN ; 0xEB9EA58B
+    14DC: [71 ED F0 39] UNKNOWN ; 0x39F0ED71
+    14E0: [DD 60 7E 60] UNKNOWN ; 0x607E60DD
+    14E4: [DB 6E 4D 91] UNKNOWN ; 0x914D6EDB
+    14E8: [D4 EC 14 79] UNKNOWN ; 0x7914ECD4
+    14EC: [D3 FE 9A 0D] UNKNOWN ; 0xD9AFED3
+    14F0: [C9 70 EC A2] UNKNOWN ; 0xA2EC70C9
+    14F4: [51 1F 92 A4] UNKNOWN ; 0xA4921F51
+    14F8: [E0 3B 1D 85] UNKNOWN ; 0x851D3BE0
+    14FC: [C3 B9 E4 E2] UNKNOWN ; 0xE2E4B9C3
+    1500: [0A EB DB 20] UNKNOWN ; 0x20DBEB0A
+    1504: [9A 8D 81 72] UNKNOWN ; 0x72818D9A
+    1508: [C7 2D 61 46] UNKNOWN ; 0x46612DC7
+    150C: [4E 71 44 B4] UNKNOWN ; 0xB444714E
+    1510: [65 7C C2 34] UNKNOWN ; 0x34C27C65
+    1514: [0F DF 7F DE] UNKNOWN ; 0xDE7FDF0F
+    1518: [C6 3B 7C 32] UNKNOWN ; 0x327C3BC6
+    151C: [11 48 EA 4D] UNKNOWN ; 0x4DEA4811
+    1520: [96 BD 93 16] UNKNOWN ; 0x1693BD96
+    1524: [FA 83 4B A8] UNKNOWN ; 0xA84B83FA
+    1528: [FC 43 25 64] UNKNOWN ; 0x642543FC
+    152C: [23 87 BB C1] SB s11, s7
+    1530: [B9 96 20 38] UNKNOWN ; 0x382096B9
+    1534: [F6 43 08 D7] UNKNOWN ; 0xD70843F6
+    1538: [06 42 F9 D8] UNKNOWN ; 0xD8F94206
+    153C: [7E 2E FA 09] UNKNOWN ; 0x9FA2E7E
+    1540: [0D 8E 6F 52] UNKNOWN ; 0x526F8E0D
+    1544: [A0 7E 1E 72] UNKNOWN ; 0x721E7EA0
+    1548: [2B 37 93 F6] UNKNOWN ; 0xF693372B
+    154C: [44 EB B8 8D] UNKNOWN ; 0x8DB8EB44
+    1550: [6A 78 A1 CF] UNKNOWN ; 0xCFA1786A
+    1554: [C2 CA 10 E0] UNKNOWN ; 0xE010CAC2
+    1558: [5E A0 EC 44] UNKNOWN ; 0x44ECA05E
+    155C: [8D 58 58 A6] UNKNOWN ; 0xA658588D
+    1560: [7B 5D 75 27] UNKNOWN ; 0x27755D7B
+    1564: [69 F9 80 D7] UNKNOWN ; 0xD780F969
+    1568: [26 96 75 92] UNKNOWN ; 0x92759626
+    156C: [4B 14 CD 36] UNKNOWN ; 0x36CD144B
+    1570: [0E 3B 58 79] UNKNOWN ; 0x79583B0E
+    1574: [02 60 5C 4D] UNKNOWN ; 0x4D5C6002
+    1578: [8D FE F5 88] UNKNOWN ; 0x88F5FE8D
+    157C: [1E 05 1D F1] UNKNOWN ; 0xF11D051E
+    1580: [97 3D 8A 1F] AUIPC s11, 0x1F8A3
+    1584: [C9 02 F5 06] UNKNOWN ; 0x6F502C9
+    1588: [3E AC F9 87] UNKNOWN ; 0x87F9AC3E
+    158C: [5E 48 C9 5E] UNKNOWN ; 0x5EC9485E
+    1590: [13 B7 60 C2] SLTIU a4, ra, 3110
+    1594: [52 D5 D2 C7] UNKNOWN ; 0xC7D2D552
+    1598: [69 2F F5 71] UNKNOWN ; 0x71F52F69
+    159C: [ED 63 60 23] UNKNOWN ; 0x236063ED
+    15A0: [46 2B 56 41] UNKNOWN ; 0x41562B46
+    15A4: [06 12 34 F7] UNKNOWN ; 0xF7341206
+    15A8: [CB B7 1B EC] UNKNOWN ; 0xEC1BB7CB
+    15AC: [0E 5D BA 4C] UNKNOWN ; 0x4CBA5D0E
+    15B0: [EC 51 CB 4B] UNKNOWN ; 0x4BCB51EC
+    15B4: [2F A5 B8 F4] UNKNOWN ; 0xF4B8A52F
+    15B8: [21 D6 CA FE] UNKNOWN ; 0xFECAD621
+    15BC: [3B 7F 5E B2] UNKNOWN ; 0xB25E7F3B
+    15C0: [79 D1 50 B0] UNKNOWN ; 0xB050D179
+    15C4: [5B 05 D5 3C] UNKNOWN ; 0x3CD5055B
+    15C8: [33 61 98 00] OR sp, a6, s1
+    15CC: [3D 0C 57 B2] UNKNOWN ; 0xB2570C3D
+    15D0: [74 6D 8B 72] UNKNOWN ; 0x728B6D74
+    15D4: [72 1E 2A 27] UNKNOWN ; 0x272A1E72
+    15D8: [1F 3B 30 26] UNKNOWN ; 0x26303B1F
+    15DC: [28 29 7C 0C] UNKNOWN ; 0xC7C2928
+    15E0: [BD 69 4E C9] UNKNOWN ; 0xC94E69BD
+    15E4: [98 BB 20 3B] UNKNOWN ; 0x3B20BB98
+    15E8: [6A 79 C6 6B] UNKNOWN ; 0x6BC6796A
+    15EC: [72 43 5F 3E] UNKNOWN ; 0x3E5F4372
+    15F0: [73 BA E5 15] UNKNOWN ; 0x15E5BA73
+    15F4: [CA AE 0C 9C] UNKNOWN ; 0x9C0CAECA
+    15F8: [E8 08 BB F3] UNKNOWN ; 0xF3BB08E8
+    15FC: [E0 32 3E 01] UNKNOWN ; 0x13E32E0
+    1600: [11 A6 9C CC] UNKNOWN ; 0xCC9CA611
+    1604: [F0 BE 26 D3] UNKNOWN ; 0xD326BEF0
+    1608: [F5 0D 93 9B] UNKNOWN ; 0x9B930DF5
+    160C: [C1 77 17 AF] UNKNOWN ; 0xAF1777C1
+    1610: [2A BE 4C 91] UNKNOWN ; 0x914CBE2A
+    1614: [09 C2 62 C4] UNKNOWN ; 0xC462C209
+    1618: [0D 88 04 13] UNKNOWN ; 0x1304880D
+    161C: [D6 10 12 48] UNKNOWN ; 0x481210D6
+    1620: [2E CB 85 FB] UNKNOWN ; 0xFB85CB2E
+    1624: [C1 C2 F0 21] UNKNOWN ; 0x21F0C2C1
+    1628: [B7 86 3E 4D] LUI a3, 0x4D3E8
+    162C: [00 44 2E 60] UNKNOWN ; 0x602E4400
+    1630: [4A D1 21 86] UNKNOWN ; 0x8621D14A
+    1634: [37 DA 53 E4] LUI s4, 0xE453D
+    1638: [BF BD 71 7D] UNKNOWN ; 0x7D71BDBF
+    163C: [45 5D 1F 5D] UNKNOWN ; 0x5D1F5D45
+    1640: [02 C1 EC 78] UNKNOWN ; 0x78ECC102
+    1644: [4D 37 4F 91] UNKNOWN ; 0x914F374D
+    1648: [2F D1 A7 04] UNKNOWN ; 0x4A7D12F
+    164C: [18 93 40 90] UNKNOWN ; 0x90409318
+    1650: [19 5B A8 E4] UNKNOWN ; 0xE4A85B19
+    1654: [CD 60 D9 CE] UNKNOWN ; 0xCED960CD
+    1658: [AF 58 14 7E] UNKNOWN ; 0x7E1458AF
+    165C: [BF EE 28 EE] UNKNOWN ; 0xEE28EEBF
+    1660: [D8 A5 B6 64] UNKNOWN ; 0x64B6A5D8
+    1664: [E5 7C 7F 41] UNKNOWN ; 0x417F7CE5
+    1668: [42 B9 54 DC] UNKNOWN ; 0xDC54B942
+    166C: [92 55 24 B6] UNKNOWN ; 0xB6245592
+    1670: [93 8D 2F DC] ADDI s11, t6, 3522
+    1674: [23 F6 36 E7] UNKNOWN ; 0xE736F623
+    1678: [D4 C5 0F B8] UNKNOWN ; 0xB80FC5D4
+    167C: [B0 3B EE 25] UNKNOWN ; 0x25EE3BB0
+    1680: [EC 12 51 E8] UNKNOWN ; 0xE85112EC
+    1684: [5B 70 B9 58] UNKNOWN ; 0x58B9705B
+    1688: [49 19 7E 59] UNKNOWN ; 0x597E1949
+    168C: [E3 FE 69 86] BGEU s3, t1, 0xC16A8
+    1690: [30 F4 D2 1A] UNKNOWN ; 0x1AD2F430
+    1694: [EB B7 1A E4] UNKNOWN ; 0xE41AB7EB
+    1698: [58 B7 08 59] UNKNOWN ; 0x5908B758
+    169C: [8A 6E 1D 61] UNKNOWN ; 0x611D6E8A
+    16A0: [F6 59 04 9A] UNKNOWN ; 0x9A0459F6
+    16A4: [3F B5 9C 32] UNKNOWN ; 0x329CB53F
+    16A8: [45 86 70 C9] UNKNOWN ; 0xC9708645
+    16AC: [F1 8F 4A AF] UNKNOWN ; 0xAF4A8FF1
+    16B0: [57 1E 01 BC] UNKNOWN ; 0xBC011E57
+    16B4: [82 F7 0A 18] UNKNOWN ; 0x180AF782
+    16B8: [8B 35 32 A1] UNKNOWN ; 0xA132358B
+    16BC: [C4 61 E3 FA] UNKNOWN ; 0xFAE361C4
+    16C0: [F7 DE D1 99] UNKNOWN ; 0x99D1DEF7
+    16C4: [0E AE 59 07] UNKNOWN ; 0x759AE0E
+    16C8: [38 D1 82 AA] UNKNOWN ; 0xAA82D138
+    16CC: [3F BE 3C 5D] UNKNOWN ; 0x5D3CBE3F
+    16D0: [03 83 27 93] LB t1, -1742(a5)
+    16D4: [42 59 7E 94] UNKNOWN ; 0x947E5942
+    16D8: [63 F0 E6 03] BGEU a3, t5, 0x416D8
+    16DC: [F7 8D D5 D9] UNKNOWN ; 0xD9D58DF7
+    16E0: [A7 2A F0 8B] UNKNOWN ; 0x8BF02AA7
+    16E4: [41 EC A3 93] UNKNOWN ; 0x93A3EC41
+    16E8: [0E 94 87 46] UNKNOWN ; 0x4687940E
+    16EC: [E3 94 A0 47] BNE ra, s10, 0x8C16F4
+    16F0: [91 FE 80 12] UNKNOWN ; 0x1280FE91
+    16F4: [EF 78 EC 3A] JAL a7, 0x3C5BB
+    16F8: [5F F3 C2 9C] UNKNOWN ; 0x9CC2F35F
+    16FC: [A2 71 97 E1] UNKNOWN ; 0xE19771A2
+    1700: [66 AC 44 D7] UNKNOWN ; 0xD744AC66
+    1704: [B5 49 52 72] UNKNOWN ; 0x725249B5
+    1708: [66 24 5C 48] UNKNOWN ; 0x485C2466
+    170C: [3B 5C 39 6B] UNKNOWN ; 0x6B395C3B
+    1710: [CB EC 88 AB] UNKNOWN ; 0xAB88ECCB
+    1714: [FC 84 6B 04] UNKNOWN ; 0x46B84FC
+    1718: [36 7D 2C A0] UNKNOWN ; 0xA02C7D36
+    171C: [D6 81 36 1F] UNKNOWN ; 0x1F3681D6
+    1720: [EB F0 6F AE] UNKNOWN ; 0xAE6FF0EB
+    1724: [61 D1 F7 65] UNKNOWN ; 0x65F7D161
+    1728: [C0 E9 37 DF] UNKNOWN ; 0xDF37E9C0
+    172C: [D2 DC 69 5E] UNKNOWN ; 0x5E69DCD2
+    1730: [E4 EC 17 B2] UNKNOWN ; 0xB217ECE4
+    1734: [4D 67 E3 0F] UNKNOWN ; 0xFE3674D
+    1738: [C7 C2 5C 14] UNKNOWN ; 0x145CC2C7
+    173C: [BC 74 3F 8D] UNKNOWN ; 0x8D3F74BC
+    1740: [E5 C2 F9 9D] UNKNOWN ; 0x9DF9C2E5
+    1744: [28 01 02 04] UNKNOWN ; 0x4020128
+    1748: [16 43 31 59] UNKNOWN ; 0x59314316
+    174C: [BC 4F 36 F9] UNKNOWN ; 0xF9364FBC
+    1750: [FD 00 AB 6A] UNKNOWN ; 0x6AAB00FD
+    1754: [3F 3D 7C 32] UNKNOWN ; 0x327C3D3F
+    1758: [4B C5 C5 AC] UNKNOWN ; 0xACC5C54B
+    175C: [FA 8A 30 B0] UNKNOWN ; 0xB0308AFA
+    1760: [17 5B 75 2C] AUIPC s6, 0x2C755
+    1764: [B2 AC 25 1F] UNKNOWN ; 0x1F25ACB2
+    1768: [0F 52 86 A0] UNKNOWN ; 0xA086520F
+    176C: [26 8E 84 BD] UNKNOWN ; 0xBD848E26
+    1770: [EE F1 30 F0] UNKNOWN ; 0xF030F1EE
+    1774: [8F 8A 77 E3] UNKNOWN ; 0xE3778A8F
+    1778: [2D 1D 93 13] UNKNOWN ; 0x13931D2D
+    177C: [FB 80 3B D3] UNKNOWN ; 0xD33B80FB
+    1780: [6E 79 F9 D9] UNKNOWN ; 0xD9F9796E
+    1784: [68 9D 4D 88] UNKNOWN ; 0x884D9D68
+    1788: [38 18 3E B5] UNKNOWN ; 0xB53E1838
+    178C: [00 8B 94 29] UNKNOWN ; 0x29948B00
+    1790: [F0 53 78 67] UNKNOWN ; 0x677853F0
+    1794: [9A 8A 52 CA] UNKNOWN ; 0xCA528A9A
+    1798: [32 86 08 C4] UNKNOWN ; 0xC4088632
+    179C: [9E 7E 99 D1] UNKNOWN ; 0xD1997E9E
+    17A0: [32 37 51 14] UNKNOWN ; 0x14513732
+    17A4: [50 2C EF B8] UNKNOWN ; 0xB8EF2C50
+    17A8: [DF 7E 30 29] UNKNOWN ; 0x29307EDF
+    17AC: [7E EF 3B D5] UNKNOWN ; 0xD53BEF7E
+    17B0: [CF C8 62 FF] UNKNOWN ; 0xFF62C8CF
+    17B4: [C8 8C 92 8E] UNKNOWN ; 0x8E928CC8
+    17B8: [16 B2 35 9F] UNKNOWN ; 0x9F35B216
+    17BC: [2E C7 D5 B4] UNKNOWN ; 0xB4D5C72E
+    17C0: [ED A3 E8 2A] UNKNOWN ; 0x2AE8A3ED
+    17C4: [2C 55 69 2D] UNKNOWN ; 0x2D69552C
+    17C8: [34 A9 20 21] UNKNOWN ; 0x2120A934
+    17CC: [E5 7C B4 68] UNKNOWN ; 0x68B47CE5
+    17D0: [C5 EC 63 72] UNKNOWN ; 0x7263ECC5
+    17D4: [D6 25 A5 8C] UNKNOWN ; 0x8CA525D6
+    17D8: [DE F4 DD 8B] UNKNOWN ; 0x8BDDF4DE
+    17DC: [39 95 94 62] UNKNOWN ; 0x62949539
+    17E0: [70 F4 63 FD] UNKNOWN ; 0xFD63F470
+    17E4: [B1 1A D1 2E] UNKNOWN ; 0x2ED11AB1
+    17E8: [30 27 A5 2F] UNKNOWN ; 0x2FA52730
+    17EC: [0A 89 20 49] UNKNOWN ; 0x4920890A
+    17F0: [FB 10 BC A2] UNKNOWN ; 0xA2BC10FB
+    17F4: [21 DD B6 26] UNKNOWN ; 0x26B6DD21
+    17F8: [AE 4A C2 70] UNKNOWN ; 0x70C24AAE
+    17FC: [56 96 47 98] UNKNOWN ; 0x98479656
+    1800: [07 29 A4 8E] UNKNOWN ; 0x8EA42907
+    1804: [C8 74 52 DD] UNKNOWN ; 0xDD5274C8
+    1808: [FF F0 16 F1] UNKNOWN ; 0xF116F0FF
+    180C: [CE CE 29 06] UNKNOWN ; 0x629CECE
+    1810: [D3 61 49 1E] UNKNOWN ; 0x1E4961D3
+    1814: [9E AF 33 CF] UNKNOWN ; 0xCF33AF9E
+    1818: [8A 48 D2 D5] UNKNOWN ; 0xD5D2488A
+    181C: [BB C3 89 2D] UNKNOWN ; 0x2D89C3BB
+    1820: [2A DB 44 BB] UNKNOWN ; 0xBB44DB2A
+    1824: [A1 4C A6 E2] UNKNOWN ; 0xE2A64CA1
+    1828: [BE 34 85 44] UNKNOWN ; 0x448534BE
+    182C: [1A 76 82 55] UNKNOWN ; 0x5582761A
+    1830: [46 2B B9 1E] UNKNOWN ; 0x1EB92B46
+    1834: [F5 FA 52 86] UNKNOWN ; 0x8652FAF5
+    1838: [7C 00 30 BF] UNKNOWN ; 0xBF30007C
+    183C: [31 FE 90 E9] UNKNOWN ; 0xE990FE31
+    1840: [A3 4F 71 DA] UNKNOWN ; 0xDA714FA3
+    1844: [93 C9 E9 24] XORI s3, s3, 590
+    1848: [05 24 71 58] UNKNOWN ; 0x58712405
+    184C: [73 34 03 7C] UNKNOWN ; 0x7C033473
+    1850: [96 81 59 23] UNKNOWN ; 0x23598196
+    1854: [DB A5 C4 F1] UNKNOWN ; 0xF1C4A5DB
+    1858: [90 13 19 8E] UNKNOWN ; 0x8E191390
+    185C: [1D 56 D5 6D] UNKNOWN ; 0x6DD5561D
+    1860: [E8 51 AC AB] UNKNOWN ; 0xABAC51E8
+    1864: [18 00 98 17] UNKNOWN ; 0x17980018
+    1868: [24 8C CB 5B] UNKNOWN ; 0x5BCB8C24
+    186C: [59 69 A0 FE] UNKNOWN ; 0xFEA06959
+    1870: [4B 30 2E 69] UNKNOWN ; 0x692E304B
+    1874: [C4 F5 1C B7] UNKNOWN ; 0xB71CF5C4
+    1878: [C2 90 35 1A] UNKNOWN ; 0x1A3590C2
+    187C: [B5 38 AC 38] UNKNOWN ; 0x38AC38B5
+    1880: [00 A0 23 24] UNKNOWN ; 0x2423A000
+    1884: [7F 69 CD 76] UNKNOWN ; 0x76CD697F
+    1888: [C9 13 EE 38] UNKNOWN ; 0x38EE13C9
+    188C: [04 56 94 AB] UNKNOWN ; 0xAB945604
+    1890: [0F DE 00 C2] UNKNOWN ; 0xC200DE0F
+    1894: [9B C3 55 76] UNKNOWN ; 0x7655C39B
+    1898: [3D AC 27 1F] UNKNOWN ; 0x1F27AC3D
+    189C: [6E 6C 78 8F] UNKNOWN ; 0x8F786C6E
+    18A0: [D5 66 B0 32] UNKNOWN ; 0x32B066D5
+    18A4: [D2 F5 9C 48] UNKNOWN ; 0x489CF5D2
+    18A8: [AE 02 DB 76] UNKNOWN ; 0x76DB02AE
+    18AC: [7F 53 45 C8] UNKNOWN ; 0xC845537F
+    18B0: [A0 2F CB 35] UNKNOWN ; 0x35CB2FA0
+    18B4: [5E A4 D0 57] UNKNOWN ; 0x57D0A45E
+    18B8: [FC 19 5F 3D] UNKNOWN ; 0x3D5F19FC
+    18BC: [CB 58 62 40] UNKNOWN ; 0x406258CB
+    18C0: [7C B3 9D BC] UNKNOWN ; 0xBC9DB37C
+    18C4: [A3 02 69 0A] SB t1, s2
+    18C8: [E5 2D DE 3B] UNKNOWN ; 0x3BDE2DE5
+    18CC: [2D 50 49 68] UNKNOWN ; 0x6849502D
+    18D0: [00 22 C2 8F] UNKNOWN ; 0x8FC22200
+    18D4: [16 0F B4 52] UNKNOWN ; 0x52B40F16
+    18D8: [76 9F 9E 15] UNKNOWN ; 0x159E9F76
+    18DC: [51 64 60 E9] UNKNOWN ; 0xE9606451
+    18E0: [9C 33 87 84] UNKNOWN ; 0x8487339C
+    18E4: [D6 C2 52 76] UNKNOWN ; 0x7652C2D6
+    18E8: [E7 57 BC B2] UNKNOWN ; 0xB2BC57E7
+    18EC: [45 C8 B9 14] UNKNOWN ; 0x14B9C845
+    18F0: [CF 82 91 72] UNKNOWN ; 0x729182CF
+    18F4: [94 C7 8F C2] UNKNOWN ; 0xC28FC794
+    18F8: [7D 44 A2 30] UNKNOWN ; 0x30A2447D
+    18FC: [75 7F 41 17] UNKNOWN ; 0x17417F75
+    1900: [A1 9C BA 07] UNKNOWN ; 0x7BA9CA1
+    1904: [0D 16 AE F8] UNKNOWN ; 0xF8AE160D
+    1908: [70 ED 6A 46] UNKNOWN ; 0x466AED70
+    190C: [AE 9B 4B 5B] UNKNOWN ; 0x5B4B9BAE
+    1910: [04 28 9B 68] UNKNOWN ; 0x689B2804
+    1914: [06 0D 74 CC] UNKNOWN ; 0xCC740D06
+    1918: [DD 7A D1 19] UNKNOWN ; 0x19D17ADD
+    191C: [31 C6 0A C4] UNKNOWN ; 0xC40AC631
+    1920: [12 BE 27 6D] UNKNOWN ; 0x6D27BE12
+    1924: [CA D5 58 F7] UNKNOWN ; 0xF758D5CA
+    1928: [E3 BB 25 82] UNKNOWN ; 0x8225BBE3
+    192C: [D2 41 0C 37] UNKNOWN ; 0x370C41D2
+    1930: [40 79 67 10] UNKNOWN ; 0x10677940
+    1934: [D0 73 8E 78] UNKNOWN ; 0x788E73D0
+    1938: [44 35 0E AA] UNKNOWN ; 0xAA0E3544
+    193C: [A7 F6 A0 FE] UNKNOWN ; 0xFEA0F6A7
+    1940: [72 0A AC F4] UNKNOWN ; 0xF4AC0A72
+    1944: [11 6E DE 0B] UNKNOWN ; 0xBDE6E11
+    1948: [23 9C DC B3] SH t4
+    194C: [E8 19 E4 61] UNKNOWN ; 0x61E419E8
+    1950: [56 A0 17 73] UNKNOWN ; 0x7317A056
+    1954: [04 64 1A 6B] UNKNOWN ; 0x6B1A6404
+    1958: [4C 5C 32 D5] UNKNOWN ; 0xD5325C4C
+    195C: [E9 F0 8A DF] UNKNOWN ; 0xDF8AF0E9
+    1960: [33 00 00 00] ADD zero, zero, zero
+    1964: [B3 8F FF 01] ADD t6, t6, t6
+    1968: [33 0A 5A 00] ADD s4, s4, t0
+    196C: [B3 85 A5 01] ADD a1, a1, s10
+    1970: [33 00 00 40] SUB zero, zero, zero
+    1974: [B3 8F FF 41] SUB t6, t6, t6
+    1978: [33 0A 5A 40] SUB s4, s4, t0
+    197C: [B3 85 A5 41] SUB a1, a1, s10
+    1980: [33 10 00 00] SLL zero, zero, zero
+    1984: [B3 9F FF 01] SLL t6, t6, t6
+    1988: [33 1A 5A 00] SLL s4, s4, t0
+    198C: [B3 95 A5 01] SLL a1, a1, s10
+    1990: [33 20 00 00] SLT zero, zero, zero
+    1994: [B3 AF FF 01] SLT t6, t6, t6
+    1998: [33 2A 5A 00] SLT s4, s4, t0
+    199C: [B3 A5 A5 01] SLT a1, a1, s10
+    19A0: [33 30 00 00] SLTU zero, zero, zero
+    19A4: [B3 BF FF 01] SLTU t6, t6, t6
+    19A8: [33 3A 5A 00] SLTU s4, s4, t0
+    19AC: [B3 B5 A5 01] SLTU a1, a1, s10
+    19B0: [33 40 00 00] XOR zero, zero, zero
+    19B4: [B3 CF FF 01] XOR t6, t6, t6
+    19B8: [33 4A 5A 00] XOR s4, s4, t0
+    19BC: [B3 C5 A5 01] XOR a1, a1, s10
+    19C0: [33 50 00 00] SRL zero, zero, zero
+    19C4: [B3 DF FF 01] SRL t6, t6, t6
+    19C8: [33 5A 5A 00] SRL s4, s4, t0
+    19CC: [B3 D5 A5 01] SRL a1, a1, s10
+    19D0: [33 50 00 40] SRA zero, zero, zero
+    19D4: [B3 DF FF 41] SRA t6, t6, t6
+    19D8: [33 5A 5A 40] SRA s4, s4, t0
+    19DC: [B3 D5 A5 41] SRA a1, a1, s10
+    19E0: [33 60 00 00] OR zero, zero, zero
+    19E4: [B3 EF FF 01] OR t6, t6, t6
+    19E8: [33 6A 5A 00] OR s4, s4, t0
+    19EC: [B3 E5 A5 01] OR a1, a1, s10
+    19F0: [33 70 00 00] AND zero, zero, zero
+    19F4: [B3 FF FF 01] AND t6, t6, t6
+    19F8: [33 7A 5A 00] AND s4, s4, t0
+    19FC: [B3 F5 A5 01] AND a1, a1, s10
+    1A00: [13 00 00 00] ADDI zero, zero, 0
+    1A04: [93 8F FF FF] ADDI t6, t6, 4095
+    1A08: [13 0A 5A 5A] ADDI s4, s4, 1445
+    1A0C: [93 85 A5 A5] ADDI a1, a1, 2650
+    1A10: [13 20 00 00] SLTI zero, zero, 0
+    1A14: [93 AF FF FF] SLTI t6, t6, 4095
+    1A18: [13 2A 5A 5A] SLTI s4, s4, 1445
+    1A1C: [93 A5 A5 A5] SLTI a1, a1, 2650
+    1A20: [13 30 00 00] SLTIU zero, zero, 0
+    1A24: [93 BF FF FF] SLTIU t6, t6, 4095
+    1A28: [13 3A 5A 5A] SLTIU s4, s4, 1445
+    1A2C: [93 B5 A5 A5] SLTIU a1, a1, 2650
+    1A30: [13 40 00 00] XORI zero, zero, 0
+    1A34: [93 CF FF FF] XORI t6, t6, 4095
+    1A38: [13 4A 5A 5A] XORI s4, s4, 1445
+    1A3C: [93 C5 A5 A5] XORI a1, a1, 2650
+    1A40: [13 60 00 00] ORI zero, zero, 0
+    1A44: [93 EF FF FF] ORI t6, t6, 4095
+    1A48: [13 6A 5A 5A] ORI s4, s4, 1445
+    1A4C: [93 E5 A5 A5] ORI a1, a1, 2650
+    1A50: [13 70 00 00] ANDI zero, zero, 0
+    1A54: [93 FF FF FF] ANDI t6, t6, 4095
+    1A58: [13 7A 5A 5A] ANDI s4, s4, 1445
+    1A5C: [93 F5 A5 A5] ANDI a1, a1, 2650
+    1A60: [13 10 00 00] SLLI zero, zero, 0
+    1A64: [93 9F FF 01] SLLI t6, t6, 31
+    1A68: [13 1A 5A 00] SLLI s4, s4, 5
+    1A6C: [93 95 A5 01] SLLI a1, a1, 26
+    1A70: [13 50 00 00] SRLI zero, zero, 0
+    1A74: [93 DF FF 01] SRLI t6, t6, 31
+    1A78: [13 5A 5A 00] SRLI s4, s4, 5
+    1A7C: [93 D5 A5 01] SRLI a1, a1, 26
+    1A80: [13 50 00 40] SRAI zero, zero, 0
+    1A84: [93 DF FF 41] SRAI t6, t6, 31
+    1A88: [13 5A 5A 40] SRAI s4, s4, 5
+    1A8C: [93 D5 A5 41] SRAI a1, a1, 26
+    1A90: [03 00 00 00] LB zero, 0(zero)
+    1A94: [83 8F FF FF] LB t6, -1(t6)
+    1A98: [03 0A 5A 5A] LB s4, 1445(s4)
+    1A9C: [83 85 A5 A5] LB a1, -1446(a1)
+    1AA0: [03 10 00 00] LH zero
+    1AA4: [83 9F FF FF] LH t6
+    1AA8: [03 1A 5A 5A] LH s4
+    1AAC: [83 95 A5 A5] LH a1
+    1AB0: [03 20 00 00] LW zero, 0(zero)
+    1AB4: [83 AF FF FF] LW t6, -1(t6)
+    1AB8: [03 2A 5A 5A] LW s4, 1445(s4)
+    1ABC: [83 A5 A5 A5] LW a1, -1446(a1)
+    1AC0: [03 40 00 00] LBU zero, 0(zero)
+    1AC4: [83 CF FF FF] LBU t6, -1(t6)
+    1AC8: [03 4A 5A 5A] LBU s4, 1445(s4)
+    1ACC: [83 C5 A5 A5] LBU a1, -1446(a1)
+    1AD0: [03 50 00 00] LHU zero
+    1AD4: [83 DF FF FF] LHU t6
+    1AD8: [03 5A 5A 5A] LHU s4
+    1ADC: [83 D5 A5 A5] LHU a1
+    1AE0: [23 00 00 00] SB zero, zero
+    1AE4: [A3 8F FF FF] SB t6, t6
+    1AE8: [23 0A 5A 5A] SB t0, s4
+    1AEC: [A3 85 A5 A5] SB s10, a1
+    1AF0: [23 10 00 00] SH zero
+    1AF4: [A3 9F FF FF] SH t6
+    1AF8: [23 1A 5A 5A] SH t0
+    1AFC: [A3 95 A5 A5] SH s10
+    1B00: [23 20 00 00] SW zero, zero
+    1B04: [A3 AF FF FF] SW t6, t6
+    1B08: [23 2A 5A 5A] SW t0, s4
+    1B0C: [A3 A5 A5 A5] SW s10, a1
+    1B10: [63 00 00 00] BEQ zero, zero, 0x1B10
+    1B14: [E3 8F FF FF] BEQ t6, t6, 0xFC1B32
+    1B18: [63 0A 5A 5A] BEQ s4, t0, 0xB41B2C
+    1B1C: [E3 85 A5 A5] BEQ a1, s10, 0x481B26
+    1B20: [63 10 00 00] BNE zero, zero, 0x1B20
+    1B24: [E3 9F FF FF] BNE t6, t6, 0xFC1B42
+    1B28: [63 1A 5A 5A] BNE s4, t0, 0xB41B3C
+    1B2C: [E3 95 A5 A5] BNE a1, s10, 0x481B36
+    1B30: [63 40 00 00] BLT zero, zero, 0x1B30
+    1B34: [E3 CF FF FF] BLT t6, t6, 0xFC1B52
+    1B38: [63 4A 5A 5A] BLT s4, t0, 0xB41B4C
+    1B3C: [E3 C5 A5 A5] BLT a1, s10, 0x481B46
+    1B40: [63 50 00 00] BGE zero, zero, 0x1B40
+    1B44: [E3 DF FF FF] BGE t6, t6, 0xFC1B62
+    1B48: [63 5A 5A 5A] BGE s4, t0, 0xB41B5C
+    1B4C: [E3 D5 A5 A5] BGE a1, s10, 0x481B56
+    1B50: [63 60 00 00] BLTU zero, zero, 0x1B50
+    1B54: [E3 EF FF FF] BLTU t6, t6, 0xFC1B72
+    1B58: [63 6A 5A 5A] BLTU s4, t0, 0xB41B6C
+    1B5C: [E3 E5 A5 A5] BLTU a1, s10, 0x481B66
+    1B60: [63 70 00 00] BGEU zero, zero, 0x1B60
+    1B64: [E3 FF FF FF] BGEU t6, t6, 0xFC1B82
+    1B68: [63 7A 5A 5A] BGEU s4, t0, 0xB41B7C
+    1B6C: [E3 F5 A5 A5] BGEU a1, s10, 0x481B76
+    1B70: [6F 00 00 00] JAL zero, 0x1B70
+    1B74: [EF FF FF FF] JAL t6, 0x81A73
+    1B78: [6F 5A 5A 5A] JAL s4, 0x5C01D
+    1B7C: [EF A5 A5 A5] JAL a1, 0x275D6
+    1B80: [67 00 00 00] JALR zero, zero, 0x0
+    1B84: [E7 8F FF FF] JALR t6, t6, 0xFFF
+    1B88: [67 0A 5A 5A] JALR s4, s4, 0x5A5
+    1B8C: [E7 85 A5 A5] JALR a1, a1, 0xA5A
+    1B90: [37 00 00 00] LUI zero, 0x0
+    1B94: [B7 FF FF FF] LUI t6, 0xFFFFF
+    1B98: [37 5A 5A 5A] LUI s4, 0x5A5A5
+    1B9C: [B7 A5 A5 A5] LUI a1, 0xA5A5A
+    1BA0: [17 00 00 00] AUIPC zero, 0x0
+    1BA4: [97 FF FF FF] AUIPC t6, 0xFFFFF
+    1BA8: [17 5A 5A 5A] AUIPC s4, 0x5A5A5
+    1BAC: [97 A5 A5 A5] AUIPC a1, 0xA5A5A
+    1BB0: [73 00 00 00] ECALL
+    1BB4: [73 00 00 00] ECALL
+    1BB8: [73 00 00 00] ECALL
+    1BBC: [73 00 00 00] ECALL
+    1BC0: [73 00 10 00] EBREAK
+    1BC4: [73 00 10 00] EBREAK
+    1BC8: [73 00 10 00] EBREAK
+    1BCC: [73 00 10 00] EBREAK
\ No newline at end of file
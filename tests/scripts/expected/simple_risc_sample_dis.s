@@ -0,0 +1,656 @@
+; Disassembly of SimpleRISC16 v1.0
+; Word size: 16 bits
+; Endianness: little
+
+    1000: [8C 5C] LDI
+    1002: [1E 78] ST
+    1004: [00 7B] ST
+    1006: [F1 48] OR
+    1008: [BD 6A] LD
+    100A: [05 3A] AND
+    100C: [5E 72] ST
+    100E: [7F 01] UNKNOWN ; 0x017F
+    1010: [D6 68] LD
+    1012: [A8 DA] UNKNOWN ; 0xDAA8
+    1014: [5F A8] JNZ 0x85F
+    1016: [04 B6] CALL 0x604
+    1018: [44 42] OR
+    101A: [E4 3C] AND
+    101C: [8F A2] JNZ 0x28F
+    101E: [F1 38] AND
+    1020: [97 02] UNKNOWN ; 0x0297
+    1022: [ED 4B] OR
+    1024: [52 4D] OR
+    1026: [9E D0] UNKNOWN ; 0xD09E
+    1028: [C6 55] LDI
+    102A: [AD AA] JNZ 0xAAD
+    102C: [56 24] SUB
+    102E: [A1 F3] UNKNOWN ; 0xF3A1
+    1030: [50 BE] CALL 0xE50
+    1032: [23 9A] JZ 0xA23
+    1034: [63 4F] OR
+    1036: [AD 05] UNKNOWN ; 0x05AD
+    1038: [0B CA] UNKNOWN ; 0xCA0B
+    103A: [68 38] AND
+    103C: [C9 F4] UNKNOWN ; 0xF4C9
+    103E: [50 9A] JZ 0xA50
+    1040: [E5 40] OR
+    1042: [37 05] UNKNOWN ; 0x0537
+    1044: [BF E4] UNKNOWN ; 0xE4BF
+    1046: [69 27] SUB
+    1048: [C1 CE] UNKNOWN ; 0xCEC1
+    104A: [25 9B] JZ 0xB25
+    104C: [DB AA] JNZ 0xADB
+    104E: [86 A1] JNZ 0x186
+    1050: [01 07] UNKNOWN ; 0x0701
+    1052: [F8 76] ST
+    1054: [F0 74] ST
+    1056: [43 99] JZ 0x943
+    1058: [72 A0] JNZ 0x72
+    105A: [1B B4] CALL 0x41B
+    105C: [D5 4B] OR
+    105E: [45 FC] UNKNOWN ; 0xFC45
+    1060: [6E 39] AND
+    1062: [5B C8] UNKNOWN ; 0xC85B
+    1064: [4E 4F] OR
+    1066: [9D 5C] LDI
+    1068: [1B 42] OR
+    106A: [97 6B] LD
+    106C: [AE C9] UNKNOWN ; 0xC9AE
+    106E: [00 16] ADD
+    1070: [08 59] LDI
+    1072: [89 7E] ST
+    1074: [51 6C] LD
+    1076: [49 84] JMP 0x449
+    1078: [9D A4] JNZ 0x49D
+    107A: [19 2C] SUB
+    107C: [C9 F2] UNKNOWN ; 0xF2C9
+    107E: [09 90] JZ 0x9
+    1080: [03 4B] OR
+    1082: [29 94] JZ 0x429
+    1084: [44 0B] UNKNOWN ; 0x0B44
+    1086: [65 48] OR
+    1088: [50 F9] UNKNOWN ; 0xF950
+    108A: [67 15] ADD
+    108C: [23 D5] UNKNOWN ; 0xD523
+    108E: [FC FF] UNKNOWN ; 0xFFFC
+    1090: [53 CA] UNKNOWN ; 0xCA53
+    1092: [95 01] UNKNOWN ; 0x0195
+    1094: [FB 85] JMP 0x5FB
+    1096: [81 5F] LDI
+    1098: [1B 3C] AND
+    109A: [69 7D] ST
+    109C: [8D 27] SUB
+    109E: [12 4F] OR
+    10A0: [E2 4D] OR
+    10A2: [00 51] LDI
+    10A4: [FC 75] ST
+    10A6: [1E 74] ST
+    10A8: [D3 10] ADD
+    10AA: [0C 2A] SUB
+    10AC: [04 B3] CALL 0x304
+    10AE: [74 7B] ST
+    10B0: [56 BA] CALL 0xA56
+    10B2: [8C D9] UNKNOWN ; 0xD98C
+    10B4: [58 03] UNKNOWN ; 0x0358
+    10B6: [F4 71] ST
+    10B8: [A9 D7] UNKNOWN ; 0xD7A9
+    10BA: [42 DD] UNKNOWN ; 0xDD42
+    10BC: [D5 7D] ST
+    10BE: [94 03] UNKNOWN ; 0x0394
+    10C0: [34 EB] UNKNOWN ; 0xEB34
+    10C2: [02 D7] UNKNOWN ; 0xD702
+    10C4: [9E 79] ST
+    10C6: [F1 B2] CALL 0x2F1
+    10C8: [B5 CB] UNKNOWN ; 0xCBB5
+    10CA: [78 1F] ADD
+    10CC: [4A 74] ST
+    10CE: [3C D5] UNKNOWN ; 0xD53C
+    10D0: [EF 9C] JZ 0xCEF
+    10D2: [01 14] ADD
+    10D4: [CD 7F] ST
+    10D6: [82 A7] JNZ 0x782
+    10D8: [D3 05] UNKNOWN ; 0x05D3
+    10DA: [D4 F7] UNKNOWN ; 0xF7D4
+    10DC: [D9 24] SUB
+    10DE: [03 B5] CALL 0x503
+    10E0: [75 3B] AND
+    10E2: [66 EB] UNKNOWN ; 0xEB66
+    10E4: [FD 67] LD
+    10E6: [92 E5] UNKNOWN ; 0xE592
+    10E8: [87 5E] LDI
+    10EA: [74 08] UNKNOWN ; 0x0874
+    10EC: [0A 8A] JMP 0xA0A
+    10EE: [01 0B] UNKNOWN ; 0x0B01
+    10F0: [CC A8] JNZ 0x8CC
+    10F2: [71 A6] JNZ 0x671
+    10F4: [67 66] LD
+    10F6: [93 9A] JZ 0xA93
+    10F8: [C2 51] LDI
+    10FA: [3B 7A] ST
+    10FC: [D8 82] JMP 0x2D8
+    10FE: [23 AB] JNZ 0xB23
+    1100: [E8 F3] UNKNOWN ; 0xF3E8
+    1102: [57 D0] UNKNOWN ; 0xD057
+    1104: [67 C8] UNKNOWN ; 0xC867
+    1106: [40 AE] JNZ 0xE40
+    1108: [C8 A7] JNZ 0x7C8
+    110A: [79 D4] UNKNOWN ; 0xD479
+    110C: [26 D1] UNKNOWN ; 0xD126
+    110E: [26 12] ADD
+    1110: [51 3A] AND
+    1112: [EA 51] LDI
+    1114: [D4 19] ADD
+    1116: [23 B5] CALL 0x523
+    1118: [D7 17] ADD
+    111A: [AF 8A] JMP 0xAAF
+    111C: [1B 1F] ADD
+    111E: [3D 3E] AND
+    1120: [56 02] UNKNOWN ; 0x0256
+    1122: [F1 64] LD
+    1124: [26 A0] JNZ 0x26
+    1126: [ED 0B] UNKNOWN ; 0x0BED
+    1128: [33 EB] UNKNOWN ; 0xEB33
+    112A: [DC D7] UNKNOWN ; 0xD7DC
+    112C: [14 1D] ADD
+    112E: [E6 BC] CALL 0xCE6
+    1130: [D2 AF] JNZ 0xFD2
+    1132: [58 0C] UNKNOWN ; 0x0C58
+    1134: [C9 F0] UNKNOWN ; 0xF0C9
+    1136: [C5 D8] UNKNOWN ; 0xD8C5
+    1138: [F0 C3] UNKNOWN ; 0xC3F0
+    113A: [86 64] LD
+    113C: [36 27] SUB
+    113E: [55 E6] UNKNOWN ; 0xE655
+    1140: [6B A3] JNZ 0x36B
+    1142: [84 B1] CALL 0x184
+    1144: [66 41] OR
+    1146: [59 3D] AND
+    1148: [9B 2D] SUB
+    114A: [05 95] JZ 0x505
+    114C: [DA 02] UNKNOWN ; 0x02DA
+    114E: [29 3D] AND
+    1150: [80 86] JMP 0x680
+    1152: [93 3E] AND
+    1154: [42 EB] UNKNOWN ; 0xEB42
+    1156: [B8 1D] ADD
+    1158: [A1 1A] ADD
+    115A: [12 A4] JNZ 0x412
+    115C: [B1 25] SUB
+    115E: [81 44] OR
+    1160: [69 63] LD
+    1162: [30 68] LD
+    1164: [E0 09] UNKNOWN ; 0x09E0
+    1166: [AD 67] LD
+    1168: [E6 76] ST
+    116A: [34 E2] UNKNOWN ; 0xE234
+    116C: [F1 BA] CALL 0xAF1
+    116E: [66 77] ST
+    1170: [F3 75] ST
+    1172: [87 42] OR
+    1174: [FE 09] UNKNOWN ; 0x09FE
+    1176: [21 0F] UNKNOWN ; 0x0F21
+    1178: [C3 07] UNKNOWN ; 0x07C3
+    117A: [04 B5] CALL 0x504
+    117C: [BD 32] AND
+    117E: [76 6D] LD
+    1180: [CB AA] JNZ 0xACB
+    1182: [5F 41] OR
+    1184: [C8 EC] UNKNOWN ; 0xECC8
+    1186: [99 F7] UNKNOWN ; 0xF799
+    1188: [BA 80] JMP 0xBA
+    118A: [5C 62] LD
+    118C: [71 1A] ADD
+    118E: [E9 CF] UNKNOWN ; 0xCFE9
+    1190: [46 37] AND
+    1192: [1A 1D] ADD
+    1194: [7B 6A] LD
+    1196: [EE A1] JNZ 0x1EE
+    1198: [B5 1B] ADD
+    119A: [A4 48] OR
+    119C: [AA 1D] ADD
+    119E: [AD 74] ST
+    11A0: [1A 6F] LD
+    11A2: [25 24] SUB
+    11A4: [2C D7] UNKNOWN ; 0xD72C
+    11A6: [52 66] LD
+    11A8: [CF 3C] AND
+    11AA: [39 20] SUB
+    11AC: [08 E2] UNKNOWN ; 0xE208
+    11AE: [98 21] SUB
+    11B0: [47 E0] UNKNOWN ; 0xE047
+    11B2: [55 67] LD
+    11B4: [CE 6E] LD
+    11B6: [59 80] JMP 0x59
+    11B8: [91 39] AND
+    11BA: [42 65] LD
+    11BC: [42 2F] SUB
+    11BE: [C0 5C] LDI
+    11C0: [DC AA] JNZ 0xADC
+    11C2: [FE 7E] ST
+    11C4: [60 D3] UNKNOWN ; 0xD360
+    11C6: [94 2C] SUB
+    11C8: [4A DC] UNKNOWN ; 0xDC4A
+    11CA: [73 68] LD
+    11CC: [6D 35] AND
+    11CE: [82 A8] JNZ 0x882
+    11D0: [35 6D] LD
+    11D2: [C6 D8] UNKNOWN ; 0xD8C6
+    11D4: [9F 05] UNKNOWN ; 0x059F
+    11D6: [FB 7C] ST
+    11D8: [FE 4D] OR
+    11DA: [8D 92] JZ 0x28D
+    11DC: [82 4B] OR
+    11DE: [67 F9] UNKNOWN ; 0xF967
+    11E0: [AE 1F] ADD
+    11E2: [F6 D8] UNKNOWN ; 0xD8F6
+    11E4: [82 13] ADD
+    11E6: [60 C0] UNKNOWN ; 0xC060
+    11E8: [45 FE] UNKNOWN ; 0xFE45
+    11EA: [62 C9] UNKNOWN ; 0xC962
+    11EC: [12 4E] OR
+    11EE: [B6 BC] CALL 0xCB6
+    11F0: [BD 7F] ST
+    11F2: [D7 3D] AND
+    11F4: [CC 88] JMP 0x8CC
+    11F6: [F6 A4] JNZ 0x4F6
+    11F8: [E1 78] ST
+    11FA: [8A 35] AND
+    11FC: [E8 96] JZ 0x6E8
+    11FE: [26 71] ST
+    1200: [A0 80] JMP 0xA0
+    1202: [2F 22] SUB
+    1204: [85 7D] ST
+    1206: [AB 8D] JMP 0xDAB
+    1208: [5C 14] ADD
+    120A: [67 C3] UNKNOWN ; 0xC367
+    120C: [EA A1] JNZ 0x1EA
+    120E: [BF FD] UNKNOWN ; 0xFDBF
+    1210: [34 AB] JNZ 0xB34
+    1212: [79 1B] ADD
+    1214: [56 B9] CALL 0x956
+    1216: [04 A9] JNZ 0x904
+    1218: [32 50] LDI
+    121A: [E0 0E] UNKNOWN ; 0x0EE0
+    121C: [5D 76] ST
+    121E: [9B 14] ADD
+    1220: [6A CE] UNKNOWN ; 0xCE6A
+    1222: [19 7F] ST
+    1224: [56 BA] CALL 0xA56
+    1226: [50 C1] UNKNOWN ; 0xC150
+    1228: [6D 0D] UNKNOWN ; 0x0D6D
+    122A: [6B 83] JMP 0x36B
+    122C: [B7 55] LDI
+    122E: [19 88] JMP 0x819
+    1230: [E5 2B] SUB
+    1232: [8E 19] ADD
+    1234: [01 B6] CALL 0x601
+    1236: [46 5D] LDI
+    1238: [03 67] LD
+    123A: [7B 48] OR
+    123C: [24 64] LD
+    123E: [95 10] ADD
+    1240: [14 39] AND
+    1242: [DB 30] AND
+    1244: [41 74] ST
+    1246: [BA 35] AND
+    1248: [E7 B7] CALL 0x7E7
+    124A: [58 03] UNKNOWN ; 0x0358
+    124C: [8C A1] JNZ 0x18C
+    124E: [0D 00] UNKNOWN ; 0x000D
+    1250: [BD 38] AND
+    1252: [49 55] LDI
+    1254: [2A 65] LD
+    1256: [58 9B] JZ 0xB58
+    1258: [84 9F] JZ 0xF84
+    125A: [10 34] AND
+    125C: [33 0E] UNKNOWN ; 0x0E33
+    125E: [EF 44] OR
+    1260: [00 E7] UNKNOWN ; 0xE700
+    1262: [E5 A3] JNZ 0x3E5
+    1264: [DE 05] UNKNOWN ; 0x05DE
+    1266: [E0 62] LD
+    1268: [03 A0] JNZ 0x3
+    126A: [C2 0E] UNKNOWN ; 0x0EC2
+    126C: [B5 25] SUB
+    126E: [87 AA] JNZ 0xA87
+    1270: [D0 F4] UNKNOWN ; 0xF4D0
+    1272: [18 89] JMP 0x918
+    1274: [1B B1] CALL 0x11B
+    1276: [B2 F3] UNKNOWN ; 0xF3B2
+    1278: [FA 38] AND
+    127A: [F4 34] AND
+    127C: [EC 80] JMP 0xEC
+    127E: [F3 C9] UNKNOWN ; 0xC9F3
+    1280: [6F D8] UNKNOWN ; 0xD86F
+    1282: [C6 A0] JNZ 0xC6
+    1284: [A5 DA] UNKNOWN ; 0xDAA5
+    1286: [02 8A] JMP 0xA02
+    1288: [AD A9] JNZ 0x9AD
+    128A: [A2 D3] UNKNOWN ; 0xD3A2
+    128C: [73 A3] JNZ 0x373
+    128E: [8B B9] CALL 0x98B
+    1290: [0B BE] CALL 0xE0B
+    1292: [96 F1] UNKNOWN ; 0xF196
+    1294: [5E EA] UNKNOWN ; 0xEA5E
+    1296: [89 44] OR
+    1298: [85 83] JMP 0x385
+    129A: [3A 07] UNKNOWN ; 0x073A
+    129C: [7D 9D] JZ 0xD7D
+    129E: [D2 9C] JZ 0xCD2
+    12A0: [5A CC] UNKNOWN ; 0xCC5A
+    12A2: [DC CD] UNKNOWN ; 0xCDDC
+    12A4: [BD 82] JMP 0x2BD
+    12A6: [6D F8] UNKNOWN ; 0xF86D
+    12A8: [FA 37] AND
+    12AA: [B5 78] ST
+    12AC: [9D 94] JZ 0x49D
+    12AE: [2D 7B] ST
+    12B0: [6D 59] LDI
+    12B2: [FF 22] SUB
+    12B4: [D4 B6] CALL 0x6D4
+    12B6: [F2 75] ST
+    12B8: [81 BF] CALL 0xF81
+    12BA: [F9 B7] CALL 0x7F9
+    12BC: [0E E8] UNKNOWN ; 0xE80E
+    12BE: [3A 2C] SUB
+    12C0: [D8 1B] ADD
+    12C2: [8B 30] AND
+    12C4: [C0 05] UNKNOWN ; 0x05C0
+    12C6: [88 17] ADD
+    12C8: [68 EE] UNKNOWN ; 0xEE68
+    12CA: [B2 5F] LDI
+    12CC: [FD BA] CALL 0xAFD
+    12CE: [69 49] OR
+    12D0: [57 FF] UNKNOWN ; 0xFF57
+    12D2: [48 A7] JNZ 0x748
+    12D4: [57 D0] UNKNOWN ; 0xD057
+    12D6: [9A A4] JNZ 0x49A
+    12D8: [0F F4] UNKNOWN ; 0xF40F
+    12DA: [DB 18] ADD
+    12DC: [C4 27] SUB
+    12DE: [BE 09] UNKNOWN ; 0x09BE
+    12E0: [93 2F] SUB
+    12E2: [00 EE] UNKNOWN ; 0xEE00
+    12E4: [E7 9C] JZ 0xCE7
+    12E6: [57 B0] CALL 0x57
+    12E8: [09 C2] UNKNOWN ; 0xC209
+    12EA: [CD B0] CALL 0xCD
+    12EC: [16 1E] ADD
+    12EE: [82 B8] CALL 0x882
+    12F0: [BA F2] UNKNOWN ; 0xF2BA
+    12F2: [DF C2] UNKNOWN ; 0xC2DF
+    12F4: [D7 3A] AND
+    12F6: [34 58] LDI
+    12F8: [1C 34] AND
+    12FA: [35 91] JZ 0x135
+    12FC: [AF 6F] LD
+    12FE: [3B 17] ADD
+    1300: [9D 2E] SUB
+    1302: [40 EF] UNKNOWN ; 0xEF40
+    1304: [FF 16] ADD
+    1306: [29 76] ST
+    1308: [2C 14] ADD
+    130A: [28 E2] UNKNOWN ; 0xE228
+    130C: [5C 08] UNKNOWN ; 0x085C
+    130E: [FA 92] JZ 0x2FA
+    1310: [8D 26] SUB
+    1312: [0D 27] SUB
+    1314: [EB AD] JNZ 0xDEB
+    1316: [C9 B9] CALL 0x9C9
+    1318: [A8 C7] UNKNOWN ; 0xC7A8
+    131A: [66 28] SUB
+    131C: [D1 C5] UNKNOWN ; 0xC5D1
+    131E: [84 34] AND
+    1320: [E0 6A] LD
+    1322: [E9 0A] UNKNOWN ; 0x0AE9
+    1324: [BB C0] UNKNOWN ; 0xC0BB
+    1326: [B5 5A] LDI
+    1328: [7C 1D] ADD
+    132A: [9F AE] JNZ 0xE9F
+    132C: [68 DD] UNKNOWN ; 0xDD68
+    132E: [2E 67] LD
+    1330: [F4 68] LD
+    1332: [4F 42] OR
+    1334: [6F 1F] ADD
+    1336: [64 9C] JZ 0xC64
+    1338: [1C 62] LD
+    133A: [5F 98] JZ 0x85F
+    133C: [8A 31] AND
+    133E: [88 5A] LDI
+    1340: [33 BE] CALL 0xE33
+    1342: [ED 70] ST
+    1344: [CE 5F] LDI
+    1346: [DB 6E] LD
+    1348: [57 04] UNKNOWN ; 0x0457
+    134A: [02 58] LDI
+    134C: [4A 31] AND
+    134E: [91 D3] UNKNOWN ; 0xD391
+    1350: [83 14] ADD
+    1352: [6C 36] AND
+    1354: [97 F3] UNKNOWN ; 0xF397
+    1356: [36 62] LD
+    1358: [40 69] LD
+    135A: [BE E2] UNKNOWN ; 0xE2BE
+    135C: [91 C8] UNKNOWN ; 0xC891
+    135E: [03 0E] UNKNOWN ; 0x0E03
+    1360: [F2 97] JZ 0x7F2
+    1362: [30 36] AND
+    1364: [90 69] LD
+    1366: [F1 C5] UNKNOWN ; 0xC5F1
+    1368: [6E BB] CALL 0xB6E
+    136A: [01 AB] JNZ 0xB01
+    136C: [8D 8D] JMP 0xD8D
+    136E: [72 57] LDI
+    1370: [23 0B] UNKNOWN ; 0x0B23
+    1372: [3E 84] JMP 0x43E
+    1374: [7B FE] UNKNOWN ; 0xFE7B
+    1376: [E4 67] LD
+    1378: [4E 59] LDI
+    137A: [71 05] UNKNOWN ; 0x0571
+    137C: [D7 A6] JNZ 0x6D7
+    137E: [8E 25] SUB
+    1380: [BC 6A] LD
+    1382: [58 3C] AND
+    1384: [5C F6] UNKNOWN ; 0xF65C
+    1386: [69 52] LDI
+    1388: [BE 2A] SUB
+    138A: [88 67] LD
+    138C: [6D 0E] UNKNOWN ; 0x0E6D
+    138E: [4A 60] LD
+    1390: [E5 0A] UNKNOWN ; 0x0AE5
+    1392: [3C DE] UNKNOWN ; 0xDE3C
+    1394: [6E 66] LD
+    1396: [4E A3] JNZ 0x34E
+    1398: [26 D9] UNKNOWN ; 0xD926
+    139A: [F5 BF] CALL 0xFF5
+    139C: [8B 72] ST
+    139E: [D2 A6] JNZ 0x6D2
+    13A0: [6A EE] UNKNOWN ; 0xEE6A
+    13A2: [46 09] UNKNOWN ; 0x0946
+    13A4: [A0 24] SUB
+    13A6: [7B E5] UNKNOWN ; 0xE57B
+    13A8: [51 F7] UNKNOWN ; 0xF751
+    13AA: [01 00] UNKNOWN ; 0x0001
+    13AC: [EB 2A] SUB
+    13AE: [7C BC] CALL 0xC7C
+    13B0: [54 E2] UNKNOWN ; 0xE254
+    13B2: [5E FE] UNKNOWN ; 0xFE5E
+    13B4: [EC 31] AND
+    13B6: [7B AA] JNZ 0xA7B
+    13B8: [16 95] JZ 0x516
+    13BA: [59 4B] OR
+    13BC: [35 9D] JZ 0xD35
+    13BE: [09 AB] JNZ 0xB09
+    13C0: [9F F8] UNKNOWN ; 0xF89F
+    13C2: [05 97] JZ 0x705
+    13C4: [7A 69] LD
+    13C6: [86 F5] UNKNOWN ; 0xF586
+    13C8: [9F D7] UNKNOWN ; 0xD79F
+    13CA: [B3 06] UNKNOWN ; 0x06B3
+    13CC: [27 0D] UNKNOWN ; 0x0D27
+    13CE: [05 1E] ADD
+    13D0: [31 E6] UNKNOWN ; 0xE631
+    13D2: [A0 D2] UNKNOWN ; 0xD2A0
+    13D4: [BD 84] JMP 0x4BD
+    13D6: [D3 D0] UNKNOWN ; 0xD0D3
+    13D8: [87 89] JMP 0x987
+    13DA: [45 00] UNKNOWN ; 0x0045
+    13DC: [14 F8] UNKNOWN ; 0xF814
+    13DE: [11 20] SUB
+    13E0: [58 50] LDI
+    13E2: [37 9B] JZ 0xB37
+    13E4: [3F 9D] JZ 0xD3F
+    13E6: [76 14] ADD
+    13E8: [2C 96] JZ 0x62C
+    13EA: [C0 88] JMP 0x8C0
+    13EC: [77 4D] OR
+    13EE: [68 72] ST
+    13F0: [88 25] SUB
+    13F2: [E0 98] JZ 0x8E0
+    13F4: [E3 6D] LD
+    13F6: [70 F1] UNKNOWN ; 0xF170
+    13F8: [6D 48] OR
+    13FA: [1A 90] JZ 0x1A
+    13FC: [25 9C] JZ 0xC25
+    13FE: [45 CE] UNKNOWN ; 0xCE45
+    1400: [94 68] LD
+    1402: [DE 88] JMP 0x8DE
+    1404: [13 15] ADD
+    1406: [D7 E7] UNKNOWN ; 0xE7D7
+    1408: [88 B0] CALL 0x88
+    140A: [2A C6] UNKNOWN ; 0xC62A
+    140C: [7B EC] UNKNOWN ; 0xEC7B
+    140E: [F7 25] SUB
+    1410: [EC 9D] JZ 0xDEC
+    1412: [E7 0A] UNKNOWN ; 0x0AE7
+    1414: [38 4C] OR
+    1416: [37 43] OR
+    1418: [99 4D] OR
+    141A: [1A A7] JNZ 0x71A
+    141C: [2B F5] UNKNOWN ; 0xF52B
+    141E: [8F B2] CALL 0x28F
+    1420: [B8 71] ST
+    1422: [B6 EB] UNKNOWN ; 0xEBB6
+    1424: [8E B9] CALL 0x98E
+    1426: [DD 50] LDI
+    1428: [17 13] ADD
+    142A: [1A E7] UNKNOWN ; 0xE71A
+    142C: [5D D0] UNKNOWN ; 0xD05D
+    142E: [8F D1] UNKNOWN ; 0xD18F
+    1430: [BC E4] UNKNOWN ; 0xE4BC
+    1432: [E2 A0] JNZ 0xE2
+    1434: [C0 42] OR
+    1436: [99 60] LD
+    1438: [95 4E] OR
+    143A: [1B DE] UNKNOWN ; 0xDE1B
+    143C: [71 A6] JNZ 0x671
+    143E: [EE FD] UNKNOWN ; 0xFDEE
+    1440: [F1 F3] UNKNOWN ; 0xF3F1
+    1442: [88 90] JZ 0x88
+    1444: [3E C9] UNKNOWN ; 0xC93E
+    1446: [37 7A] ST
+    1448: [94 05] UNKNOWN ; 0x0594
+    144A: [CA 1F] ADD
+    144C: [6C 1D] ADD
+    144E: [A9 55] LDI
+    1450: [7D E3] UNKNOWN ; 0xE37D
+    1452: [7D FF] UNKNOWN ; 0xFF7D
+    1454: [DE 66] LD
+    1456: [E3 45] OR
+    1458: [EB F3] UNKNOWN ; 0xF3EB
+    145A: [8F DD] UNKNOWN ; 0xDD8F
+    145C: [20 73] ST
+    145E: [27 4A] OR
+    1460: [CE D5] UNKNOWN ; 0xD5CE
+    1462: [94 C8] UNKNOWN ; 0xC894
+    1464: [E5 37] AND
+    1466: [A8 45] OR
+    1468: [EE F6] UNKNOWN ; 0xF6EE
+    146A: [A2 03] UNKNOWN ; 0x03A2
+    146C: [77 79] ST
+    146E: [2D B3] CALL 0x32D
+    1470: [0D 01] UNKNOWN ; 0x010D
+    1472: [2D B8] CALL 0x82D
+    1474: [A4 32] AND
+    1476: [75 DF] UNKNOWN ; 0xDF75
+    1478: [19 15] ADD
+    147A: [7E CC] UNKNOWN ; 0xCC7E
+    147C: [35 6B] LD
+    147E: [D6 27] SUB
+    1480: [10 F5] UNKNOWN ; 0xF510
+    1482: [C7 97] JZ 0x7C7
+    1484: [92 F8] UNKNOWN ; 0xF892
+    1486: [4E 39] AND
+    1488: [81 ED] UNKNOWN ; 0xED81
+    148A: [01 56] LDI
+    148C: [A6 68] LD
+    148E: [56 92] JZ 0x256
+    1490: [F0 C4] UNKNOWN ; 0xC4F0
+    1492: [AE 1B] ADD
+    1494: [3A BE] CALL 0xE3A
+    1496: [C1 F8] UNKNOWN ; 0xF8C1
+    1498: [E9 D4] UNKNOWN ; 0xD4E9
+    149A: [6A 44] OR
+    149C: [0F F8] UNKNOWN ; 0xF80F
+    149E: [75 E3] UNKNOWN ; 0xE375
+    14A0: [36 D5] UNKNOWN ; 0xD536
+    14A2: [DA CB] UNKNOWN ; 0xCBDA
+    14A4: [B5 C3] UNKNOWN ; 0xC3B5
+    14A6: [CA 02] UNKNOWN ; 0x02CA
+    14A8: [3D 51] LDI
+    14AA: [1F F9] UNKNOWN ; 0xF91F
+    14AC: [76 2B] SUB
+    14AE: [A5 5F] LDI
+    14B0: [00 00] NOP
+    14B2: [00 00] NOP
+    14B4: [00 00] NOP
+    14B6: [00 00] NOP
+    14B8: [00 10] ADD
+    14BA: [FF 1F] ADD
+    14BC: [5A 1A] ADD
+    14BE: [A5 15] ADD
+    14C0: [00 20] SUB
+    14C2: [FF 2F] SUB
+    14C4: [5A 2A] SUB
+    14C6: [A5 25] SUB
+    14C8: [00 30] AND
+    14CA: [FF 3F] AND
+    14CC: [5A 3A] AND
+    14CE: [A5 35] AND
+    14D0: [00 40] OR
+    14D2: [FF 4F] OR
+    14D4: [5A 4A] OR
+    14D6: [A5 45] OR
+    14D8: [00 50] LDI
+    14DA: [FF 5F] LDI
+    14DC: [5A 5A] LDI
+    14DE: [A5 55] LDI
+    14E0: [00 60] LD
+    14E2: [FF 6F] LD
+    14E4: [5A 6A] LD
+    14E6: [A5 65] LD
+    14E8: [00 70] ST
+    14EA: [FF 7F] ST
+    14EC: [5A 7A] ST
+    14EE: [A5 75] ST
+    14F0: [00 80] JMP 0x0
+    14F2: [FF 8F] JMP 0xFFF
+    14F4: [5A 8A] JMP 0xA5A
+    14F6: [A5 85] JMP 0x5A5
+    14F8: [00 90] JZ 0x0
+    14FA: [FF 9F] JZ 0xFFF
+    14FC: [5A 9A] JZ 0xA5A
+    14FE: [A5 95] JZ 0x5A5
+    1500: [00 A0] JNZ 0x0
+    1502: [FF AF] JNZ 0xFFF
+    1504: [5A AA] JNZ 0xA5A
+    1506: [A5 A5] JNZ 0x5A5
+    1508: [00 B0] CALL 0x0
+    150A: [FF BF] CALL 0xFFF
+    150C: [5A BA] CALL 0xA5A
+    150E: [A5 B5] CALL 0x5A5
+    1510: [00 C0] RET
+    1512: [00 C0] RET
+    1514: [00 C0] RET
+    1516: [00 C0] RET
\ No newline at end of file
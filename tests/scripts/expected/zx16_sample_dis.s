@@ -0,0 +1,763 @@
+; Disassembly of ZX16 v1.1
+; Word size: 16 bits
+; Endianness: little
+
+    1000: [8C 5C] LW x2, 5(x6)
+    1002: [1E 78] LUI x0, 0x1E3
+    1004: [00 7B] UNKNOWN ; 0x7B00
+    1006: [F1 48] XORI x3, 36
+    1008: [BD 6A] UNKNOWN ; 0x6ABD
+    100A: [05 3A] JMP 0x10F2 ; pseudo: JMP
+    100C: [5E 72] LUI x1, 0x1CB
+    100E: [7F 01] UNKNOWN ; 0x017F
+    1010: [D6 68] LUI x3, 0x1A2
+    1012: [A8 DA] UNKNOWN ; 0xDAA8
+    1014: [5F A8] UNKNOWN ; 0xA85F
+    1016: [04 B6] LB x0, -5(x3)
+    1018: [44 42] LB x1, 4(x1)
+    101A: [E4 3C] LBU x3, 3(x6)
+    101C: [8F A2] UNKNOWN ; 0xA28F
+    101E: [F1 38] XORI x3, 28
+    1020: [97 02] UNKNOWN ; 0x0297
+    1022: [ED 4B] UNKNOWN ; 0x4BED
+    1024: [52 4D] UNKNOWN ; 0x4D52
+    1026: [9E D0] LA x2, 323 ; pseudo: LA
+    1028: [C6 55] LUI x7, 0x150
+    102A: [AD AA] JAL x2, 0x10D7
+    102C: [56 24] LI16 x1, 0xFFF9 ; pseudo: LI16
+    1030: [50 BE] UNKNOWN ; 0xBE50
+    1032: [23 9A] UNKNOWN ; 0x9A23
+    1034: [63 4F] UNKNOWN ; 0x4F63
+    1036: [AD 05] UNKNOWN ; 0x05AD
+    1038: [0B CA] SW x5, -4(x0)
+    103A: [68 38] UNKNOWN ; 0x3868
+    103C: [C9 F4] SLTI x3, -6
+    103E: [50 9A] UNKNOWN ; 0x9A50
+    1040: [E5 40] UNKNOWN ; 0x40E5
+    1042: [37 05] UNKNOWN ; 0x0537
+    1044: [BF E4] UNKNOWN ; 0xE4BF
+    1046: [69 27] ANDI x5, 19
+    1048: [C1 CE] ADDI x3, -25
+    104A: [25 9B] JAL x4, 0x10B6
+    104C: [DB AA] UNKNOWN ; 0xAADB
+    104E: [86 A1] LA x6, 0x5051 ; pseudo: LA
+    1052: [F8 76] UNKNOWN ; 0x76F8
+    1054: [F0 74] UNKNOWN ; 0x74F0
+    1056: [43 99] SB x4, -7(x5)
+    1058: [72 A0] BLTU x1, x0, 0x104C
+    105A: [1B B4] UNKNOWN ; 0xB41B
+    105C: [D5 4B] UNKNOWN ; 0x4BD5
+    105E: [45 FC] CALL 0x104E ; pseudo: CALL
+    1060: [6E 39] LUI x5, 0xE5
+    1062: [5B C8] UNKNOWN ; 0xC85B
+    1064: [4E 4F] LUI x5, 0x139
+    1066: [9D 5C] UNKNOWN ; 0x5C9D
+    1068: [1B 42] UNKNOWN ; 0x421B
+    106A: [97 6B] UNKNOWN ; 0x6B97
+    106C: [AE C9] LA x6, 293 ; pseudo: LA
+    106E: [00 16] SUB x0, x3
+    1070: [08 59] UNKNOWN ; 0x5908
+    1072: [89 7E] SLTI x2, 63
+    1074: [51 6C] SLTUI x1, 54
+    1076: [49 84] SLTI x1, -62
+    1078: [9D A4] JAL x2, 0x110B
+    107A: [19 2C] SLLI x0, 6
+    107C: [C9 F2] SLTI x3, -7
+    107E: [09 90] SLTI x0, -56
+    1080: [03 4B] SB x5, 4(x4)
+    1082: [29 94] ANDI x0, -54
+    1084: [44 0B] LB x5, 0(x5)
+    1086: [65 48] UNKNOWN ; 0x4865
+    1088: [50 F9] UNKNOWN ; 0xF950
+    108A: [67 15] UNKNOWN ; 0x1567
+    108C: [23 D5] UNKNOWN ; 0xD523
+    108E: [FC FF] UNKNOWN ; 0xFFFC
+    1090: [53 CA] UNKNOWN ; 0xCA53
+    1092: [95 01] UNKNOWN ; 0x0195
+    1094: [FB 85] UNKNOWN ; 0x85FB
+    1096: [81 5F] ADDI x6, 47
+    1098: [1B 3C] UNKNOWN ; 0x3C1B
+    109A: [69 7D] ANDI x5, 62
+    109C: [8D 27] UNKNOWN ; 0x278D
+    109E: [12 4F] UNKNOWN ; 0x4F12
+    10A0: [E2 4D] BLT x7, x6, 0x10A8
+    10A2: [00 51] UNKNOWN ; 0x5100
+    10A4: [FC 75] UNKNOWN ; 0x75FC
+    10A6: [1E 74] LUI x0, 0x1D3
+    10A8: [D3 10] UNKNOWN ; 0x10D3
+    10AA: [0C 2A] LW x0, 2(x5)
+    10AC: [04 B3] LB x4, -5(x1)
+    10AE: [74 7B] UNKNOWN ; 0x7B74
+    10B0: [56 BA] LA x1, 234 ; pseudo: LA
+    10B2: [8C D9] LW x6, -3(x4)
+    10B4: [58 03] UNKNOWN ; 0x0358
+    10B6: [F4 71] UNKNOWN ; 0x71F4
+    10B8: [A9 D7] ANDI x6, -21
+    10BA: [42 DD] BEQ x5, x6, 0x10B4
+    10BC: [D5 7D] UNKNOWN ; 0x7DD5
+    10BE: [94 03] UNKNOWN ; 0x0394
+    10C0: [34 EB] UNKNOWN ; 0xEB34
+    10C2: [02 D7] BEQ x4, x3, 0x10BC
+    10C4: [9E 79] LUI x6, 0x1E3
+    10C6: [F1 B2] XORI x3, -39
+    10C8: [B5 CB] JAL x6, 0xFF6
+    10CA: [78 1F] UNKNOWN ; 0x1F78
+    10CC: [4A 74] BNE x1, x2, 0x10DA
+    10CE: [3C D5] UNKNOWN ; 0xD53C
+    10D0: [EF 9C] UNKNOWN ; 0x9CEF
+    10D2: [01 14] ADDI x0, 10
+    10D4: [CD 7F] UNKNOWN ; 0x7FCD
+    10D6: [82 A7] BEQ x6, x3, 0x10CA
+    10D8: [D3 05] UNKNOWN ; 0x05D3
+    10DA: [D4 F7] UNKNOWN ; 0xF7D4
+    10DC: [D9 24] SLLI x3, 2
+    10DE: [03 B5] SB x2, -5(x4)
+    10E0: [75 3B] UNKNOWN ; 0x3B75
+    10E2: [66 EB] LA x5, 428 ; pseudo: LA
+    10E4: [FD 67] UNKNOWN ; 0x67FD
+    10E6: [92 E5] UNKNOWN ; 0xE592
+    10E8: [87 5E] ECALL 378
+    10EA: [74 08] UNKNOWN ; 0x0874
+    10EC: [0A 8A] BNE x0, x5, 0x10DC
+    10EE: [01 0B] ADDI x4, 5
+    10F0: [CC A8] LW x3, -6(x4)
+    10F2: [71 A6] XORI x1, -45
+    10F4: [67 66] UNKNOWN ; 0x6667
+    10F6: [93 9A] UNKNOWN ; 0x9A93
+    10F8: [C2 51] BEQ x7, x0, 0x1102
+    10FA: [3B 7A] UNKNOWN ; 0x7A3B
+    10FC: [D8 82] UNKNOWN ; 0x82D8
+    10FE: [23 AB] UNKNOWN ; 0xAB23
+    1100: [E8 F3] UNKNOWN ; 0xF3E8
+    1102: [57 D0] UNKNOWN ; 0xD057
+    1104: [67 C8] UNKNOWN ; 0xC867
+    1106: [40 AE] UNKNOWN ; 0xAE40
+    1108: [C8 A7] UNKNOWN ; 0xA7C8
+    110A: [79 D4] LI x1, -22
+    110C: [26 D1] LA x4, 324 ; pseudo: LA
+    110E: [26 12] LUI x0, 0x4C
+    1110: [51 3A] SLTUI x1, 29
+    1112: [EA 51] BGE x7, x0, 0x111C
+    1114: [D4 19] UNKNOWN ; 0x19D4
+    1116: [23 B5] UNKNOWN ; 0xB523
+    1118: [D7 17] UNKNOWN ; 0x17D7
+    111A: [AF 8A] UNKNOWN ; 0x8AAF
+    111C: [1B 1F] UNKNOWN ; 0x1F1B
+    111E: [3D 3E] JMP 0x121D ; pseudo: JMP
+    1120: [56 02] LUI x1, 0xA
+    1122: [F1 64] XORI x3, 50
+    1124: [26 A0] LA x0, 132 ; pseudo: LA
+    1126: [ED 0B] UNKNOWN ; 0x0BED
+    1128: [33 EB] UNKNOWN ; 0xEB33
+    112A: [DC D7] UNKNOWN ; 0xD7DC
+    112C: [14 1D] UNKNOWN ; 0x1D14
+    112E: [E6 BC] LA x3, 244 ; pseudo: LA
+    1130: [D2 AF] UNKNOWN ; 0xAFD2
+    1132: [58 0C] UNKNOWN ; 0x0C58
+    1134: [C9 F0] SLTI x3, -8
+    1136: [C5 D8] JAL x3, 0x1096
+    1138: [F0 C3] UNKNOWN ; 0xC3F0
+    113A: [86 64] LUI x2, 0x190
+    113C: [36 27] LUI x4, 0x9E
+    113E: [55 E6] CALL 0x10D8 ; pseudo: CALL
+    1140: [6B A3] UNKNOWN ; 0xA36B
+    1142: [84 B1] LB x6, -5(x0)
+    1144: [66 41] LUI x5, 0x104
+    1146: [59 3D] SLLI x5, 14
+    1148: [9B 2D] UNKNOWN ; 0x2D9B
+    114A: [05 95] JAL x4, 0x119A
+    114C: [DA 02] UNKNOWN ; 0x02DA
+    114E: [29 3D] ANDI x4, 30
+    1150: [80 86] UNKNOWN ; 0x8680
+    1152: [93 3E] UNKNOWN ; 0x3E93
+    1154: [42 EB] BEQ x5, x5, 0x1150
+    1156: [B8 1D] UNKNOWN ; 0x1DB8
+    1158: [A1 1A] ORI x2, 13
+    115A: [12 A4] UNKNOWN ; 0xA412
+    115C: [B1 25] NEG x6, 0x2422 ; pseudo: NEG
+    1160: [69 63] ANDI x5, 49
+    1162: [30 68] UNKNOWN ; 0x6830
+    1164: [E0 09] UNKNOWN ; 0x09E0
+    1166: [AD 67] UNKNOWN ; 0x67AD
+    1168: [E6 76] LUI x3, 0x1DC
+    116A: [34 E2] UNKNOWN ; 0xE234
+    116C: [F1 BA] XORI x3, -35
+    116E: [66 77] LUI x5, 0x1DC
+    1170: [F3 75] UNKNOWN ; 0x75F3
+    1172: [87 42] ECALL 266
+    1174: [FE 09] LI16 x7, 0x807 ; pseudo: LI16
+    1178: [C3 07] SB x3, 0(x7)
+    117A: [04 B5] LB x4, -5(x2)
+    117C: [BD 32] UNKNOWN ; 0x32BD
+    117E: [76 6D] LUI x5, 0x1B6
+    1180: [CB AA] SW x5, -6(x3)
+    1182: [5F 41] UNKNOWN ; 0x415F
+    1184: [C8 EC] UNKNOWN ; 0xECC8
+    1186: [99 F7] UNKNOWN ; 0xF799
+    1188: [BA 80] BGEU x2, x0, 0x1178
+    118A: [5C 62] UNKNOWN ; 0x625C
+    118C: [71 1A] XORI x1, 13
+    118E: [E9 CF] ANDI x7, -25
+    1190: [46 37] LUI x5, 0xD8
+    1192: [1A 1D] UNKNOWN ; 0x1D1A
+    1194: [7B 6A] UNKNOWN ; 0x6A7B
+    1196: [EE A1] LA x7, 133 ; pseudo: LA
+    1198: [B5 1B] UNKNOWN ; 0x1BB5
+    119A: [A4 48] LBU x2, 4(x4)
+    119C: [AA 1D] BGE x6, x6, 0x119E
+    119E: [AD 74] UNKNOWN ; 0x74AD
+    11A0: [1A 6F] UNKNOWN ; 0x6F1A
+    11A2: [25 24] JMP 0x1236 ; pseudo: JMP
+    11A4: [2C D7] UNKNOWN ; 0xD72C
+    11A6: [52 66] UNKNOWN ; 0x6652
+    11A8: [CF 3C] UNKNOWN ; 0x3CCF
+    11AA: [39 20] LI x0, 16
+    11AC: [08 E2] UNKNOWN ; 0xE208
+    11AE: [98 21] UNKNOWN ; 0x2198
+    11B0: [47 E0] ECALL 897
+    11B2: [55 67] UNKNOWN ; 0x6755
+    11B4: [CE 6E] LUI x3, 0x1B9
+    11B6: [59 80] SRAI x1, 0
+    11B8: [91 39] SLTUI x6, 28
+    11BA: [42 65] BEQ x5, x2, 0x11C6
+    11BC: [42 2F] BEQ x5, x7, 0x11C0
+    11BE: [C0 5C] UNKNOWN ; 0x5CC0
+    11C0: [DC AA] UNKNOWN ; 0xAADC
+    11C2: [FE 7E] LUI x3, 0x1FF
+    11C4: [60 D3] UNKNOWN ; 0xD360
+    11C6: [94 2C] UNKNOWN ; 0x2C94
+    11C8: [4A DC] BNE x1, x6, 0x11C2
+    11CA: [73 68] UNKNOWN ; 0x6873
+    11CC: [6D 35] UNKNOWN ; 0x356D
+    11CE: [82 A8] BEQ x2, x4, 0x11C2
+    11D0: [35 6D] UNKNOWN ; 0x6D35
+    11D2: [C6 D8] LA x3, 352 ; pseudo: LA
+    11D4: [9F 05] UNKNOWN ; 0x059F
+    11D6: [FB 7C] UNKNOWN ; 0x7CFB
+    11D8: [FE 4D] LUI x7, 0x137
+    11DA: [8D 92] JAL x2, 0x1223
+    11DC: [82 4B] BEQ x6, x5, 0x11E4
+    11DE: [67 F9] UNKNOWN ; 0xF967
+    11E0: [AE 1F] LUI x6, 0x7D
+    11E2: [F6 D8] LA x3, 358 ; pseudo: LA
+    11E4: [82 13] BEQ x6, x1, 0x11E6
+    11E6: [60 C0] UNKNOWN ; 0xC060
+    11E8: [45 FE] CALL 0x11E0 ; pseudo: CALL
+    11EA: [62 C9] BLT x5, x4, 0x11E2
+    11EC: [12 4E] UNKNOWN ; 0x4E12
+    11EE: [B6 BC] LA x2, 246 ; pseudo: LA
+    11F0: [BD 7F] UNKNOWN ; 0x7FBD
+    11F2: [D7 3D] UNKNOWN ; 0x3DD7
+    11F4: [CC 88] LW x3, -8(x4)
+    11F6: [F6 A4] LA x3, 150 ; pseudo: LA
+    11F8: [E1 78] ORI x3, 60
+    11FA: [8A 35] BNE x6, x2, 0x1200
+    11FC: [E8 96] UNKNOWN ; 0x96E8
+    11FE: [26 71] LUI x4, 0x1C4
+    1200: [A0 80] UNKNOWN ; 0x80A0
+    1202: [2F 22] UNKNOWN ; 0x222F
+    1204: [85 7D] UNKNOWN ; 0x7D85
+    1206: [AB 8D] UNKNOWN ; 0x8DAB
+    1208: [5C 14] UNKNOWN ; 0x145C
+    120A: [67 C3] UNKNOWN ; 0xC367
+    120C: [EA A1] BGE x7, x0, 0x1200
+    120E: [BF FD] UNKNOWN ; 0xFDBF
+    1210: [34 AB] UNKNOWN ; 0xAB34
+    1212: [79 1B] LI x5, 13
+    1214: [56 B9] LA x5, 226 ; pseudo: LA
+    1216: [04 A9] LB x4, -6(x4)
+    1218: [32 50] BLTU x0, x0, 0x1222
+    121A: [E0 0E] UNKNOWN ; 0x0EE0
+    121C: [5D 76] UNKNOWN ; 0x765D
+    121E: [9B 14] UNKNOWN ; 0x149B
+    1220: [6A CE] BGE x1, x7, 0x1218
+    1222: [19 7F] UNKNOWN ; 0x7F19
+    1224: [56 BA] LA x1, 234 ; pseudo: LA
+    1226: [50 C1] UNKNOWN ; 0xC150
+    1228: [6D 0D] UNKNOWN ; 0x0D6D
+    122A: [6B 83] UNKNOWN ; 0x836B
+    122C: [B7 55] UNKNOWN ; 0x55B7
+    122E: [19 88] SRAI x0, 4
+    1230: [E5 2B] UNKNOWN ; 0x2BE5
+    1232: [8E 19] LUI x6, 0x61
+    1234: [01 B6] ADDI x0, -37
+    1236: [46 5D] LUI x5, 0x170
+    1238: [03 67] SB x3, 6(x4)
+    123A: [7B 48] UNKNOWN ; 0x487B
+    123C: [24 64] LBU x0, 6(x2)
+    123E: [95 10] UNKNOWN ; 0x1095
+    1240: [14 39] UNKNOWN ; 0x3914
+    1242: [DB 30] UNKNOWN ; 0x30DB
+    1244: [41 74] ADDI x1, 58
+    1246: [BA 35] BGEU x6, x2, 0x124C
+    1248: [E7 B7] UNKNOWN ; 0xB7E7
+    124A: [58 03] UNKNOWN ; 0x0358
+    124C: [8C A1] LW x6, -6(x0)
+    124E: [0D 00] JMP 0x124F ; pseudo: JMP
+    1250: [BD 38] UNKNOWN ; 0x38BD
+    1252: [49 55] SLTI x5, 42
+    1254: [2A 65] BGE x4, x2, 0x1260
+    1256: [58 9B] UNKNOWN ; 0x9B58
+    1258: [84 9F] LB x6, -7(x7)
+    125A: [10 34] SLTU x0, x2
+    125C: [33 0E] UNKNOWN ; 0x0E33
+    125E: [EF 44] UNKNOWN ; 0x44EF
+    1260: [00 E7] UNKNOWN ; 0xE700
+    1262: [E5 A3] JAL x7, 0x12EE
+    1264: [DE 05] LUI x7, 0x13
+    1266: [E0 62] UNKNOWN ; 0x62E0
+    1268: [03 A0] SB x0, -6(x0)
+    126A: [C2 0E] BEQ x3, x7, 0x126A
+    126C: [B5 25] UNKNOWN ; 0x25B5
+    126E: [87 AA] ECALL 682
+    1270: [D0 F4] UNKNOWN ; 0xF4D0
+    1272: [18 89] UNKNOWN ; 0x8918
+    1274: [1B B1] UNKNOWN ; 0xB11B
+    1276: [B2 F3] BLTU x6, x1, 0x1274
+    1278: [FA 38] BGEU x3, x4, 0x127E
+    127A: [F4 34] UNKNOWN ; 0x34F4
+    127C: [EC 80] UNKNOWN ; 0x80EC
+    127E: [F3 C9] UNKNOWN ; 0xC9F3
+    1280: [6F D8] UNKNOWN ; 0xD86F
+    1282: [C6 A0] LA x3, 128 ; pseudo: LA
+    1284: [A5 DA] JAL x2, 0x11F0
+    1286: [02 8A] BEQ x0, x5, 0x1276
+    1288: [AD A9] JAL x6, 0x132D
+    128A: [A2 D3] BLT x6, x1, 0x1284
+    128C: [73 A3] UNKNOWN ; 0xA373
+    128E: [8B B9] SW x4, -5(x6)
+    1290: [0B BE] SW x7, -5(x0)
+    1292: [96 F1] LA x6, 450 ; pseudo: LA
+    1294: [5E EA] LA x1, 427 ; pseudo: LA
+    1296: [89 44] SLTI x2, 34
+    1298: [85 83] JAL x6, 0x12A0
+    129A: [3A 07] BGEU x4, x3, 0x129A
+    129C: [7D 9D] JAL x5, 0x1313
+    129E: [D2 9C] UNKNOWN ; 0x9CD2
+    12A0: [5A CC] UNKNOWN ; 0xCC5A
+    12A2: [DC CD] UNKNOWN ; 0xCDDC
+    12A4: [BD 82] JAL x2, 0x12B3
+    12A6: [6D F8] CALL 0x128B ; pseudo: CALL
+    12A8: [FA 37] BGEU x7, x3, 0x12AE
+    12AA: [B5 78] UNKNOWN ; 0x78B5
+    12AC: [9D 94] JAL x2, 0x12FF
+    12AE: [2D 7B] UNKNOWN ; 0x7B2D
+    12B0: [6D 59] UNKNOWN ; 0x596D
+    12B2: [FF 22] UNKNOWN ; 0x22FF
+    12B4: [D4 B6] UNKNOWN ; 0xB6D4
+    12B6: [F2 75] BLTU x7, x2, 0x12C4
+    12B8: [81 BF] ADDI x6, -33
+    12BA: [F9 B7] LI x7, -37
+    12BC: [0E E8] LA x0, 417 ; pseudo: LA
+    12BE: [3A 2C] BGEU x0, x6, 0x12C2
+    12C0: [D8 1B] UNKNOWN ; 0x1BD8
+    12C2: [8B 30] SW x0, 3(x2)
+    12C4: [C0 05] ADD x7, x2
+    12C6: [88 17] UNKNOWN ; 0x1788
+    12C8: [68 EE] UNKNOWN ; 0xEE68
+    12CA: [B2 5F] BLTU x6, x7, 0x12D4
+    12CC: [FD BA] JAL x3, 0x13BB
+    12CE: [69 49] ANDI x5, 36
+    12D0: [57 FF] UNKNOWN ; 0xFF57
+    12D2: [48 A7] UNKNOWN ; 0xA748
+    12D4: [57 D0] UNKNOWN ; 0xD057
+    12D6: [9A A4] UNKNOWN ; 0xA49A
+    12D8: [0F F4] UNKNOWN ; 0xF40F
+    12DA: [DB 18] UNKNOWN ; 0x18DB
+    12DC: [C4 27] LB x7, 2(x3)
+    12DE: [BE 09] LUI x6, 0x27
+    12E0: [93 2F] UNKNOWN ; 0x2F93
+    12E2: [00 EE] UNKNOWN ; 0xEE00
+    12E4: [E7 9C] UNKNOWN ; 0x9CE7
+    12E6: [57 B0] UNKNOWN ; 0xB057
+    12E8: [09 C2] SLTI x0, -31
+    12EA: [CD B0] JAL x3, 0x13AB
+    12EC: [16 1E] LUI x0, 0x7A
+    12EE: [82 B8] BEQ x2, x4, 0x12E4
+    12F0: [BA F2] BGEU x2, x1, 0x12EE
+    12F2: [DF C2] UNKNOWN ; 0xC2DF
+    12F4: [D7 3A] UNKNOWN ; 0x3AD7
+    12F6: [34 58] UNKNOWN ; 0x5834
+    12F8: [1C 34] UNKNOWN ; 0x341C
+    12FA: [35 91] JAL x4, 0x1340
+    12FC: [AF 6F] UNKNOWN ; 0x6FAF
+    12FE: [3B 17] UNKNOWN ; 0x173B
+    1300: [9D 2E] UNKNOWN ; 0x2E9D
+    1302: [40 EF] UNKNOWN ; 0xEF40
+    1304: [FF 16] UNKNOWN ; 0x16FF
+    1306: [29 76] ANDI x0, 59
+    1308: [2C 14] UNKNOWN ; 0x142C
+    130A: [28 E2] UNKNOWN ; 0xE228
+    130C: [5C 08] UNKNOWN ; 0x085C
+    130E: [FA 92] BGEU x3, x1, 0x1300
+    1310: [8D 26] UNKNOWN ; 0x268D
+    1312: [0D 27] UNKNOWN ; 0x270D
+    1314: [EB AD] UNKNOWN ; 0xADEB
+    1316: [C9 B9] SLTI x7, -36
+    1318: [A8 C7] UNKNOWN ; 0xC7A8
+    131A: [66 28] LUI x1, 0xA4
+    131C: [D1 C5] SLTUI x7, -30
+    131E: [84 34] LB x2, 3(x2)
+    1320: [E0 6A] UNKNOWN ; 0x6AE0
+    1322: [E9 0A] ANDI x3, 5
+    1324: [BB C0] UNKNOWN ; 0xC0BB
+    1326: [B5 5A] UNKNOWN ; 0x5AB5
+    1328: [7C 1D] UNKNOWN ; 0x1D7C
+    132A: [9F AE] UNKNOWN ; 0xAE9F
+    132C: [68 DD] UNKNOWN ; 0xDD68
+    132E: [2E 67] LUI x4, 0x19D
+    1330: [F4 68] UNKNOWN ; 0x68F4
+    1332: [4F 42] UNKNOWN ; 0x424F
+    1334: [6F 1F] UNKNOWN ; 0x1F6F
+    1336: [64 9C] LBU x1, -7(x6)
+    1338: [1C 62] UNKNOWN ; 0x621C
+    133A: [5F 98] UNKNOWN ; 0x985F
+    133C: [8A 31] BNE x6, x0, 0x1342
+    133E: [88 5A] UNKNOWN ; 0x5A88
+    1340: [33 BE] UNKNOWN ; 0xBE33
+    1342: [ED 70] UNKNOWN ; 0x70ED
+    1344: [CE 5F] LUI x7, 0x179
+    1346: [DB 6E] UNKNOWN ; 0x6EDB
+    1348: [57 04] UNKNOWN ; 0x0457
+    134A: [02 58] BEQ x0, x4, 0x1354
+    134C: [4A 31] BNE x5, x0, 0x1352
+    134E: [91 D3] SLTUI x6, -23
+    1350: [83 14] SB x2, 1(x2)
+    1352: [6C 36] UNKNOWN ; 0x366C
+    1354: [97 F3] UNKNOWN ; 0xF397
+    1356: [36 62] LUI x0, 0x18E
+    1358: [40 69] UNKNOWN ; 0x6940
+    135A: [BE E2] LA x2, 399 ; pseudo: LA
+    135C: [91 C8] SLTUI x2, -28
+    135E: [03 0E] SB x7, 0(x0)
+    1360: [F2 97] BLTU x7, x3, 0x1352
+    1362: [30 36] UNKNOWN ; 0x3630
+    1364: [90 69] UNKNOWN ; 0x6990
+    1366: [F1 C5] XORI x7, -30
+    1368: [6E BB] LA x5, 0x89BD ; pseudo: LA
+    136C: [8D 8D] JAL x6, 0x139D
+    136E: [72 57] BLTU x5, x3, 0x1378
+    1370: [23 0B] UNKNOWN ; 0x0B23
+    1372: [3E 84] LA x0, 23 ; pseudo: LA
+    1374: [7B FE] UNKNOWN ; 0xFE7B
+    1376: [E4 67] LBU x7, 6(x3)
+    1378: [4E 59] LUI x5, 0x161
+    137A: [71 05] XORI x5, 2
+    137C: [D7 A6] UNKNOWN ; 0xA6D7
+    137E: [8E 25] LUI x6, 0x91
+    1380: [BC 6A] UNKNOWN ; 0x6ABC
+    1382: [58 3C] UNKNOWN ; 0x3C58
+    1384: [5C F6] UNKNOWN ; 0xF65C
+    1386: [69 52] ANDI x1, 41
+    1388: [BE 2A] LUI x2, 0xAF
+    138A: [88 67] UNKNOWN ; 0x6788
+    138C: [6D 0E] UNKNOWN ; 0x0E6D
+    138E: [4A 60] BNE x1, x0, 0x139A
+    1390: [E5 0A] UNKNOWN ; 0x0AE5
+    1392: [3C DE] UNKNOWN ; 0xDE3C
+    1394: [6E 66] LUI x1, 0x19D
+    1396: [4E A3] LA x5, 137 ; pseudo: LA
+    1398: [26 D9] LA x4, 356 ; pseudo: LA
+    139A: [F5 BF] JAL x7, 0x1498
+    139C: [8B 72] SW x1, 7(x2)
+    139E: [D2 A6] UNKNOWN ; 0xA6D2
+    13A0: [6A EE] BGE x1, x7, 0x139C
+    13A2: [46 09] LUI x5, 0x20
+    13A4: [A0 24] UNKNOWN ; 0x24A0
+    13A6: [7B E5] UNKNOWN ; 0xE57B
+    13A8: [51 F7] SLTUI x5, -5
+    13AA: [01 00] ADDI x0, 0
+    13AC: [EB 2A] UNKNOWN ; 0x2AEB
+    13AE: [7C BC] UNKNOWN ; 0xBC7C
+    13B0: [54 E2] UNKNOWN ; 0xE254
+    13B2: [5E FE] LA x1, 507 ; pseudo: LA
+    13B4: [EC 31] UNKNOWN ; 0x31EC
+    13B6: [7B AA] UNKNOWN ; 0xAA7B
+    13B8: [16 95] LA x4, 82 ; pseudo: LA
+    13BA: [59 4B] SRLI x5, 5
+    13BC: [35 9D] JAL x4, 0x1432
+    13BE: [09 AB] SLTI x4, -43
+    13C0: [9F F8] UNKNOWN ; 0xF89F
+    13C2: [05 97] JAL x4, 0x141A
+    13C4: [7A 69] BGEU x5, x4, 0x13D0
+    13C6: [86 F5] LA x6, 464 ; pseudo: LA
+    13C8: [9F D7] UNKNOWN ; 0xD79F
+    13CA: [B3 06] UNKNOWN ; 0x06B3
+    13CC: [27 0D] UNKNOWN ; 0x0D27
+    13CE: [05 1E] JMP 0x1446 ; pseudo: JMP
+    13D0: [31 E6] XORI x0, -13
+    13D2: [A0 D2] UNKNOWN ; 0xD2A0
+    13D4: [BD 84] JAL x2, 0x13EB
+    13D6: [D3 D0] UNKNOWN ; 0xD0D3
+    13D8: [87 89] ECALL 550
+    13DA: [45 00] UNKNOWN ; 0x0045
+    13DC: [14 F8] UNKNOWN ; 0xF814
+    13DE: [11 20] SLTUI x0, 16
+    13E0: [58 50] SRL x1, x0
+    13E2: [37 9B] UNKNOWN ; 0x9B37
+    13E4: [3F 9D] UNKNOWN ; 0x9D3F
+    13E6: [76 14] LUI x1, 0x56
+    13E8: [2C 96] UNKNOWN ; 0x962C
+    13EA: [C0 88] UNKNOWN ; 0x88C0
+    13EC: [77 4D] UNKNOWN ; 0x4D77
+    13EE: [68 72] UNKNOWN ; 0x7268
+    13F0: [88 25] SLT x6, x2
+    13F2: [E0 98] UNKNOWN ; 0x98E0
+    13F4: [E3 6D] UNKNOWN ; 0x6DE3
+    13F6: [70 F1] UNKNOWN ; 0xF170
+    13F8: [6D 48] UNKNOWN ; 0x486D
+    13FA: [1A 90] BNZ x0, 0x13EC
+    13FC: [25 9C] JAL x0, 0x1470
+    13FE: [45 CE] CALL 0x1336 ; pseudo: CALL
+    1400: [94 68] UNKNOWN ; 0x6894
+    1402: [DE 88] LA x3, 35 ; pseudo: LA
+    1404: [13 15] UNKNOWN ; 0x1513
+    1406: [D7 E7] UNKNOWN ; 0xE7D7
+    1408: [88 B0] UNKNOWN ; 0xB088
+    140A: [2A C6] BGE x0, x3, 0x1402
+    140C: [7B EC] UNKNOWN ; 0xEC7B
+    140E: [F7 25] UNKNOWN ; 0x25F7
+    1410: [EC 9D] UNKNOWN ; 0x9DEC
+    1412: [E7 0A] UNKNOWN ; 0x0AE7
+    1414: [38 4C] UNKNOWN ; 0x4C38
+    1416: [37 43] UNKNOWN ; 0x4337
+    1418: [99 4D] SRLI x6, 6
+    141A: [1A A7] UNKNOWN ; 0xA71A
+    141C: [2B F5] UNKNOWN ; 0xF52B
+    141E: [8F B2] UNKNOWN ; 0xB28F
+    1420: [B8 71] UNKNOWN ; 0x71B8
+    1422: [B6 EB] LA x6, 430 ; pseudo: LA
+    1424: [8E B9] LA x6, 225 ; pseudo: LA
+    1426: [DD 50] UNKNOWN ; 0x50DD
+    1428: [17 13] UNKNOWN ; 0x1317
+    142A: [1A E7] UNKNOWN ; 0xE71A
+    142C: [5D D0] CALL 0x136F ; pseudo: CALL
+    142E: [8F D1] UNKNOWN ; 0xD18F
+    1430: [BC E4] UNKNOWN ; 0xE4BC
+    1432: [E2 A0] BLT x3, x0, 0x1426
+    1434: [C0 42] UNKNOWN ; 0x42C0
+    1436: [99 60] UNKNOWN ; 0x6099
+    1438: [95 4E] UNKNOWN ; 0x4E95
+    143A: [1B DE] UNKNOWN ; 0xDE1B
+    143C: [71 A6] XORI x1, -45
+    143E: [EE FD] LA x7, 501 ; pseudo: LA
+    1440: [F1 F3] XORI x7, -7
+    1442: [88 90] UNKNOWN ; 0x9088
+    1444: [3E C9] LA x4, 295 ; pseudo: LA
+    1446: [37 7A] UNKNOWN ; 0x7A37
+    1448: [94 05] UNKNOWN ; 0x0594
+    144A: [CA 1F] BNE x7, x7, 0x144C
+    144C: [6C 1D] UNKNOWN ; 0x1D6C
+    144E: [A9 55] ANDI x6, 42
+    1450: [7D E3] JAL x5, 0x13DF
+    1452: [7D FF] JAL x5, 0x1451
+    1454: [DE 66] LUI x3, 0x19B
+    1456: [E3 45] UNKNOWN ; 0x45E3
+    1458: [EB F3] UNKNOWN ; 0xF3EB
+    145A: [8F DD] UNKNOWN ; 0xDD8F
+    145C: [20 73] OR x4, x1
+    145E: [27 4A] UNKNOWN ; 0x4A27
+    1460: [CE D5] LA x7, 337 ; pseudo: LA
+    1462: [94 C8] UNKNOWN ; 0xC894
+    1464: [E5 37] UNKNOWN ; 0x37E5
+    1466: [A8 45] UNKNOWN ; 0x45A8
+    1468: [EE F6] LA x3, 477 ; pseudo: LA
+    146A: [A2 03] BLT x6, x1, 0x146A
+    146C: [77 79] UNKNOWN ; 0x7977
+    146E: [2D B3] JAL x4, 0x153B
+    1470: [0D 01] UNKNOWN ; 0x010D
+    1472: [2D B8] JAL x0, 0x1557
+    1474: [A4 32] LBU x2, 3(x1)
+    1476: [75 DF] JAL x5, 0x13F4
+    1478: [19 15] UNKNOWN ; 0x1519
+    147A: [7E CC] LA x1, 311 ; pseudo: LA
+    147C: [35 6B] UNKNOWN ; 0x6B35
+    147E: [D6 27] LUI x7, 0x9A
+    1480: [10 F5] UNKNOWN ; 0xF510
+    1482: [C7 97] ECALL 607
+    1484: [92 F8] UNKNOWN ; 0xF892
+    1486: [4E 39] LUI x5, 0xE1
+    1488: [81 ED] ADDI x6, -10
+    148A: [01 56] ADDI x0, 43
+    148C: [A6 68] LUI x2, 0x1A4
+    148E: [56 92] LA x1, 74 ; pseudo: LA
+    1490: [F0 C4] UNKNOWN ; 0xC4F0
+    1492: [AE 1B] LUI x6, 0x6D
+    1494: [3A BE] BGEU x0, x7, 0x148A
+    1496: [C1 F8] ADDI x3, -4
+    1498: [E9 D4] ANDI x3, -22
+    149A: [6A 44] BGE x1, x2, 0x14A2
+    149C: [0F F8] UNKNOWN ; 0xF80F
+    149E: [75 E3] JAL x5, 0x142C
+    14A0: [36 D5] LA x4, 342 ; pseudo: LA
+    14A2: [DA CB] UNKNOWN ; 0xCBDA
+    14A4: [B5 C3] JAL x6, 0x13B2
+    14A6: [CA 02] BNE x3, x1, 0x14A6
+    14A8: [3D 51] UNKNOWN ; 0x513D
+    14AA: [1F F9] UNKNOWN ; 0xF91F
+    14AC: [76 2B] LUI x5, 0xAE
+    14AE: [A5 5F] UNKNOWN ; 0x5FA5
+    14B0: [00 00] NOP
+    14B2: [C0 0F] ADD x7, x7
+    14B4: [40 0A] ADD x1, x5
+    14B6: [80 05] ADD x6, x2
+    14B8: [00 10] SUB x0, x0
+    14BA: [C0 1F] SUB x7, x7
+    14BC: [40 1A] SUB x1, x5
+    14BE: [80 15] SUB x6, x2
+    14C0: [08 20] SLT x0, x0
+    14C2: [C8 2F] SLT x7, x7
+    14C4: [48 2A] SLT x1, x5
+    14C6: [88 25] SLT x6, x2
+    14C8: [10 30] SLTU x0, x0
+    14CA: [D0 3F] SLTU x7, x7
+    14CC: [50 3A] SLTU x1, x5
+    14CE: [90 35] SLTU x6, x2
+    14D0: [18 40] SLL x0, x0
+    14D2: [D8 4F] SLL x7, x7
+    14D4: [58 4A] SLL x1, x5
+    14D6: [98 45] SLL x6, x2
+    14D8: [18 50] SRL x0, x0
+    14DA: [D8 5F] SRL x7, x7
+    14DC: [58 5A] SRL x1, x5
+    14DE: [98 55] SRL x6, x2
+    14E0: [18 60] SRA x0, x0
+    14E2: [D8 6F] SRA x7, x7
+    14E4: [58 6A] SRA x1, x5
+    14E6: [98 65] SRA x6, x2
+    14E8: [20 70] OR x0, x0
+    14EA: [E0 7F] OR x7, x7
+    14EC: [60 7A] OR x1, x5
+    14EE: [A0 75] OR x6, x2
+    14F0: [28 80] AND x0, x0
+    14F2: [E8 8F] AND x7, x7
+    14F4: [68 8A] AND x1, x5
+    14F6: [A8 85] AND x6, x2
+    14F8: [30 90] CLR ; pseudo: CLR
+    14FA: [F0 9F] CLR ; pseudo: CLR
+    14FC: [70 9A] CLR ; pseudo: CLR
+    14FE: [B0 95] CLR ; pseudo: CLR
+    1500: [38 A0] MV x0, x0
+    1502: [F8 AF] MV x7, x7
+    1504: [78 AA] MV x1, x5
+    1506: [B8 A5] MV x6, x2
+    1508: [00 B0] RET ; pseudo: RET
+    150A: [C0 B1] RET ; pseudo: RET
+    150C: [40 B0] RET ; pseudo: RET
+    150E: [80 B1] RET ; pseudo: RET
+    1510: [00 C0] JALR x0, x0
+    1512: [C0 CF] JALR x7, x7
+    1514: [40 CA] JALR x1, x5
+    1516: [80 C5] JALR x6, x2
+    1518: [01 00] ADDI x0, 0
+    151A: [C1 FF] ADDI x7, -1
+    151C: [41 5A] ADDI x1, 45
+    151E: [81 A5] ADDI x6, -46
+    1520: [09 00] SLTI x0, 0
+    1522: [C9 FF] SLTI x7, -1
+    1524: [49 5A] SLTI x1, 45
+    1526: [89 A5] SLTI x6, -46
+    1528: [11 00] SLTUI x0, 0
+    152A: [D1 FF] SLTUI x7, -1
+    152C: [51 5A] SLTUI x1, 45
+    152E: [91 A5] SLTUI x6, -46
+    1530: [19 00] UNKNOWN ; 0x0019
+    1532: [D9 FF] UNKNOWN ; 0xFFD9
+    1534: [59 5A] SRLI x1, 13
+    1536: [99 A5] UNKNOWN ; 0xA599
+    1538: [19 00] UNKNOWN ; 0x0019
+    153A: [D9 FF] UNKNOWN ; 0xFFD9
+    153C: [59 5A] SRLI x1, 13
+    153E: [99 A5] UNKNOWN ; 0xA599
+    1540: [19 00] UNKNOWN ; 0x0019
+    1542: [D9 FF] UNKNOWN ; 0xFFD9
+    1544: [59 5A] SRLI x1, 13
+    1546: [99 A5] UNKNOWN ; 0xA599
+    1548: [21 00] ORI x0, 0
+    154A: [E1 FF] ORI x7, -1
+    154C: [61 5A] ORI x1, 45
+    154E: [A1 A5] ORI x6, -46
+    1550: [29 00] ANDI x0, 0
+    1552: [E9 FF] ANDI x7, -1
+    1554: [69 5A] ANDI x1, 45
+    1556: [A9 A5] ANDI x6, -46
+    1558: [31 00] XORI x0, 0
+    155A: [F1 FF] XORI x7, -1
+    155C: [71 5A] XORI x1, 45
+    155E: [B1 A5] XORI x6, -46
+    1560: [39 00] LI x0, 0
+    1562: [F9 FF] LI x7, -1
+    1564: [79 5A] LI x1, 45
+    1566: [B9 A5] LI x6, -46
+    1568: [02 00] BEQ x0, x0, 0x1568
+    156A: [C2 FF] BEQ x7, x7, 0x1568
+    156C: [42 5A] BEQ x1, x5, 0x1576
+    156E: [82 A5] BEQ x6, x2, 0x1562
+    1570: [0A 00] BNE x0, x0, 0x1570
+    1572: [CA FF] BNE x7, x7, 0x1570
+    1574: [4A 5A] BNE x1, x5, 0x157E
+    1576: [8A A5] BNE x6, x2, 0x156A
+    1578: [12 00] BZ x0, 0x1578
+    157A: [D2 F1] BZ x7, 0x1578
+    157C: [52 50] BZ x1, 0x1586
+    157E: [92 A1] BZ x6, 0x1572
+    1580: [1A 00] BNZ x0, 0x1580
+    1582: [DA F1] BNZ x7, 0x1580
+    1584: [5A 50] BNZ x1, 0x158E
+    1586: [9A A1] BNZ x6, 0x157A
+    1588: [22 00] BLT x0, x0, 0x1588
+    158A: [E2 FF] BLT x7, x7, 0x1588
+    158C: [62 5A] BLT x1, x5, 0x1596
+    158E: [A2 A5] BLT x6, x2, 0x1582
+    1590: [2A 00] BGE x0, x0, 0x1590
+    1592: [EA FF] BGE x7, x7, 0x1590
+    1594: [6A 5A] BGE x1, x5, 0x159E
+    1596: [AA A5] BGE x6, x2, 0x158A
+    1598: [32 00] BLTU x0, x0, 0x1598
+    159A: [F2 FF] BLTU x7, x7, 0x1598
+    159C: [72 5A] BLTU x1, x5, 0x15A6
+    159E: [B2 A5] BLTU x6, x2, 0x1592
+    15A0: [3A 00] BGEU x0, x0, 0x15A0
+    15A2: [FA FF] BGEU x7, x7, 0x15A0
+    15A4: [7A 5A] BGEU x1, x5, 0x15AE
+    15A6: [BA A5] BGEU x6, x2, 0x159A
+    15A8: [03 00] SB x0, 0(x0)
+    15AA: [C3 FF] SB x7, -1(x7)
+    15AC: [43 5A] SB x5, 5(x1)
+    15AE: [83 A5] SB x2, -6(x6)
+    15B0: [0B 00] SW x0, 0(x0)
+    15B2: [CB FF] SW x7, -1(x7)
+    15B4: [4B 5A] SW x5, 5(x1)
+    15B6: [8B A5] SW x2, -6(x6)
+    15B8: [04 00] LB x0, 0(x0)
+    15BA: [C4 FF] LB x7, -1(x7)
+    15BC: [44 5A] LB x1, 5(x5)
+    15BE: [84 A5] LB x6, -6(x2)
+    15C0: [0C 00] LW x0, 0(x0)
+    15C2: [CC FF] LW x7, -1(x7)
+    15C4: [4C 5A] LW x1, 5(x5)
+    15C6: [8C A5] LW x6, -6(x2)
+    15C8: [24 00] LBU x0, 0(x0)
+    15CA: [E4 FF] LBU x7, -1(x7)
+    15CC: [64 5A] LBU x1, 5(x5)
+    15CE: [A4 A5] LBU x6, -6(x2)
+    15D0: [05 00] JMP 0x15D0 ; pseudo: JMP
+    15D2: [3D 7E] JMP 0x15D1 ; pseudo: JMP
+    15D4: [1D 5A] JMP 0x153F ; pseudo: JMP
+    15D6: [25 24] JMP 0x166A ; pseudo: JMP
+    15D8: [05 80] JAL x0, 0x15D8
+    15DA: [FD FF] JAL x7, 0x15D9
+    15DC: [5D DA] CALL 0x1547 ; pseudo: CALL
+    15DE: [A5 A5] JAL x6, 0x1672
+    15E0: [06 00] LUI x0, 0x0
+    15E2: [FE 7F] LUI x7, 0x1FF
+    15E4: [5E 5A] LUI x1, 0x16B
+    15E6: [A6 25] LUI x6, 0x94
+    15E8: [06 80] LA x0, 0 ; pseudo: LA
+    15EA: [FE FF] LA x7, 511 ; pseudo: LA
+    15EC: [5E DA] LA x1, 363 ; pseudo: LA
+    15EE: [A6 A5] LA x6, 148 ; pseudo: LA
+    15F0: [07 00] ECALL 0
+    15F2: [C7 FF] ECALL 1023
+    15F4: [47 5A] ECALL 361
+    15F6: [87 A5] ECALL 662
\ No newline at end of file
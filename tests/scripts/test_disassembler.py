@@ -0,0 +1,230 @@
+"""
+Tests for Disassembler
+"""
+
+import copy
+import random
+from pathlib import Path
+
+import pytest
+
+from isa_xform.core.isa_loader import ISALoader
+from isa_xform.core.disassembler import Disassembler, DisassemblyResult
+from isa_xform.core.symbol_table import SymbolTable
+
+
+EXPECTED_DIR = Path(__file__).parent / "expected"
+
+
+class _EagerDisassembler(Disassembler):
+    """Disassembler that reorders its decode table and evicts cached decodes early"""
+    REORDER_INTERVAL = 64
+    DECODE_CACHE_SIZE = 16
+
+
+def _sample_words(disassembler, isa):
+    """Random words plus words matching every instruction pattern of an ISA"""
+    word_mask = (1 << isa.instruction_size) - 1
+    rng = random.Random(isa.instruction_size)
+    words = [rng.getrandbits(isa.instruction_size) for _ in range(600)]
+    for pattern in disassembler.instruction_patterns:
+        for noise in (0, word_mask, 0x5A5A5A5A, 0xA5A5A5A5):
+            words.append(pattern['opcode'] | (noise & ~pattern['mask'] & word_mask))
+    return words
+
+
+def _encode(words, size, byte_order="little"):
+    return b"".join(word.to_bytes(size, byte_order) for word in words)
+
+
+class TestDisassembler:
+    """Test cases for Disassembler"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.loader = ISALoader()
+
+    @pytest.mark.parametrize("isa_name", ["zx16", "rv32i", "simple_risc"])
+    def test_disassembly_matches_expected_output(self, isa_name):
+        """Test sample words of each bundled ISA against output recorded before the decode paths were precomputed"""
+        for name in vars(_EagerDisassembler):
+            if name.isupper():
+                assert name in vars(Disassembler)
+        isa = self.loader.load_isa(isa_name)
+        disassembler = _EagerDisassembler(isa)
+        machine_code = _encode(_sample_words(disassembler, isa), isa.instruction_size // 8)
+        expected = (EXPECTED_DIR / f"{isa_name}_sample_dis.s").read_text()
+
+        # Decodes cached at one address must still be right at the next
+        disassembler.disassemble(machine_code, 0)
+        result = disassembler.disassemble(machine_code, 0x1000)
+
+        output = disassembler.format_disassembly(result, include_machine_code=True)
+        assert output.splitlines() == expected.splitlines()
+
+    def test_overlapping_patterns_decode_to_the_first_definition(self):
+        """Test that the first defined pattern keeps winning once a later overlapping one gets more hits"""
+        isa = copy.deepcopy(self.loader.load_isa("zx16"))
+        add = isa.instructions[0]
+        add_to_zero = copy.deepcopy(add)
+        add_to_zero.mnemonic = "ADDZ"
+        add_to_zero.syntax = "ADDZ rs2"
+        for field in add_to_zero.encoding["fields"]:
+            if field["name"] == "rd":
+                field["value"] = "000"
+        isa.instructions.insert(0, add_to_zero)
+        disassembler = _EagerDisassembler(isa)
+        words = [(rs2 << 9) | (rd << 6) for _ in range(40) for rd in (1, 2, 3, 0) for rs2 in range(1, 8)]
+
+        result = disassembler.disassemble(_encode(words, 2))
+
+        assert [instr.mnemonic for instr in result.instructions] == \
+            ["ADD" if (word >> 6) & 7 else "ADDZ" for word in words]
+
+    @pytest.mark.parametrize("machine_code, data_regions, data_section_sizes", [
+        (bytes(38) + b"\x01\x00" + bytes(6) + b"\x00", [(10, 14)], {10: 4, 46: 1}),
+        (bytes(48), [(30, 34), (10, 14), (20, 20), (40, 38)], {10: 4, 30: 4}),
+        (bytes(range(1, 40)), [(3, 9), (6, 15), (30, 100)], {4: 12, 30: 8, 38: 1}),
+        (bytes(range(1, 40)), [(30, 34), (6, 15), (3, 9), (15, 18), (20, 20), (40, 38), (31, 33)],
+         {4: 14, 30: 4, 38: 1}),
+        (bytearray(40), None, {}),
+    ])
+    def test_bulk_scan_matches_word_by_word_scan(self, machine_code, data_regions, data_section_sizes):
+        """Test that zero runs and data regions decode the same as scanning one word at a time"""
+        isa = self.loader.load_isa("zx16")
+        disassembler = Disassembler(isa)
+
+        result = disassembler.disassemble(machine_code, data_regions=data_regions)
+        expected = disassembler.disassemble(machine_code, debug=True, data_regions=data_regions)
+
+        assert result.instructions == expected.instructions
+        assert result.data_sections == expected.data_sections
+        assert {addr: len(data) for addr, data in result.data_sections.items()} == data_section_sizes
+        covered = sorted([(instr.address, len(instr.machine_code)) for instr in result.instructions] +
+                         [(addr, len(data)) for addr, data in result.data_sections.items()])
+        assert [addr for addr, _ in covered] == [0] + [addr + size for addr, size in covered[:-1]]
+        for instr in result.instructions:
+            assert not any(start <= instr.address < end for start, end in data_regions or ())
+
+        # Instructions must keep their bytes when mutable input changes afterwards
+        decoded_bytes = [bytes(instr.machine_code) for instr in result.instructions]
+        if isinstance(machine_code, bytearray):
+            machine_code[:] = b"\xff" * len(machine_code)
+        assert [instr.machine_code for instr in result.instructions] == decoded_bytes
+
+    def test_iter_disassemble_matches_disassemble(self):
+        """Test that streamed instructions and data sections match a full disassembly"""
+        isa = self.loader.load_isa("zx16")
+        disassembler = Disassembler(isa)
+        machine_code = bytes(range(1, 40)) + bytes(10) + b"\x01\x00"
+        data_regions = [(3, 9), (30, 100)]
+
+        result = disassembler.disassemble(machine_code, data_regions=data_regions)
+        data_sections = {}
+        stream = disassembler.iter_disassemble(machine_code, data_regions=data_regions,
+                                               data_sections=data_sections)
+
+        assert next(stream) == result.instructions[0]
+        assert list(stream) == result.instructions[1:]
+        assert data_sections == result.data_sections
+
+    def test_big_endian_words_decode_like_little_endian(self):
+        """Test that a big-endian ISA decodes byte-swapped input to the same instructions and data"""
+        isa = self.loader.load_isa("rv32i")
+        big_endian = copy.deepcopy(isa)
+        big_endian.endianness = "big"
+        words = [0x003100B3, 0x403100B3, 0x00812283, 0x12345678, 0x04030201, 0x08070605]
+        data_regions = [(16, 24)]
+
+        little = Disassembler(isa)
+        big = Disassembler(big_endian)
+        expected = little.disassemble(_encode(words, 4), data_regions=data_regions)
+        result = big.disassemble(_encode(words, 4, "big"), data_regions=data_regions)
+
+        assert [(instr.mnemonic, instr.operands) for instr in result.instructions] == \
+            [(instr.mnemonic, instr.operands) for instr in expected.instructions]
+        # Only the header line naming the endianness differs
+        assert big.format_disassembly(result).splitlines()[3:] == little.format_disassembly(expected).splitlines()[3:]
+
+    def test_format_orders_instructions_by_address(self):
+        """Test that formatting lists instructions by address whatever order they were collected in"""
+        isa = self.loader.load_isa("zx16")
+        disassembler = Disassembler(isa)
+        result = disassembler.disassemble(bytes(range(64)))
+        instructions = result.instructions
+        shuffled = DisassemblyResult(instructions[1::2] + instructions[::2], {}, {})
+
+        assert disassembler.format_disassembly(shuffled) == disassembler.format_disassembly(result)
+
+    def test_address_operands_use_symbols_defined_before_each_call(self):
+        """Test that address operands resolve symbols defined after the disassembler was built"""
+        isa = self.loader.load_isa("simple_risc")
+        symbol_table = SymbolTable()
+        disassembler = Disassembler(isa, symbol_table)
+        machine_code = b"\x12\x80\x34\x80"
+
+        before = disassembler.disassemble(machine_code)
+        symbol_table.define_symbol("loop", 0x12)
+        symbol_table.define_symbol("again", 0x12)
+        after = disassembler.disassemble(machine_code)
+
+        assert [instr.operands for instr in before.instructions] == [["0x12"], ["0x34"]]
+        assert [instr.operands for instr in after.instructions] == [["loop"], ["0x34"]]
+
+    def test_data_sections_format_as_words_or_bytes(self):
+        """Test that data sections are emitted word by word, or byte by byte when shorter than a word"""
+        isa = self.loader.load_isa("rv32i")
+        disassembler = Disassembler(isa)
+        result = DisassemblyResult([], {}, {0x300: b"\x01\x02\x03", 0x100: b"\x48\x69\x00\x41"})
+
+        output = disassembler.format_disassembly(result, reconstruct_pseudo=False)
+
+        assert output.splitlines()[-6:] == [
+            "    ; Data section at 0x0100",
+            "    0100: .word 0x41006948",
+            "    ; Data section at 0x0300",
+            "    0300: .byte 0x01",
+            "    0301: .byte 0x02",
+            "    0302: .byte 0x03",
+        ]
+
+    def test_field_names_that_are_not_identifiers_still_decode(self):
+        """Test that ISA field names unfit for generated code decode the same as plain names"""
+        isa = self.loader.load_isa("rv32i")
+        renamed = copy.deepcopy(isa)
+        for instruction in renamed.instructions:
+            for field in instruction.encoding.get("fields", []):
+                if field.get("name") == "rd":
+                    field["name"] = "rd.0"
+            instruction.syntax = instruction.syntax.replace("rd", "rd.0")
+        machine_code = _encode([0x003100B3, 0x403100B3, 0x00812283], 4)
+
+        expected = Disassembler(isa).disassemble(machine_code)
+        result = Disassembler(renamed).disassemble(machine_code)
+
+        operands = [(instr.mnemonic, instr.operands) for instr in result.instructions]
+        assert operands == [(instr.mnemonic, instr.operands) for instr in expected.instructions]
+        assert operands == [("ADD", ["ra", "sp", "gp"]), ("SUB", ["ra", "sp", "gp"]), ("LW", ["t0", "8(sp)"])]
+
+    def test_opcode_table_matches_opcode_dict(self):
+        """Test the simple-opcode table, which none of the shipped ISAs populate"""
+        isa = self.loader.load_isa("zx16")
+        disassembler = Disassembler(isa)
+        add, sub = isa.instructions[0], isa.instructions[1]
+        disassembler.opcode_to_instruction = {0: add, 5: sub, 15: add, 99: sub}
+        disassembler._build_opcode_table()
+        assert disassembler._opcode_table is not None
+
+        for word in range(0, 1 << 16, 7):
+            expected = disassembler.opcode_to_instruction.get(disassembler._extract_simple_opcode(word))
+            assert disassembler._lookup_simple_opcode(word) is expected
+
+    def test_detect_ascii_strings_finds_maximal_printable_runs(self):
+        """Test ASCII detection, which no formatting path calls yet"""
+        isa = self.loader.load_isa("zx16")
+        disassembler = Disassembler(isa)
+        data = b"Hi\x00A\x01Hello, World!\x7f~~\x1f"
+        expected = [(0x100, 2, "Hi"), (0x105, 13, "Hello, World!"), (0x113, 2, "~~")]
+
+        assert disassembler._detect_ascii_strings(data, 0x100) == expected
+        assert disassembler._detect_ascii_strings(bytearray(data), 0x100) == expected